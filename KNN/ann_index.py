@@ -0,0 +1,210 @@
+import time
+
+import numpy as np
+from sklearn.neighbors import NearestNeighbors
+
+
+# ===== Índices de vizinhos: mesma interface fit(X) / query(Q, k) =====
+
+class ExactIndex:
+    """KD-tree, ball-tree ou força bruta do sklearn (resultado exato); leaf_size ajustável."""
+
+    def __init__(self, algorithm='kd_tree', leaf_size=30):
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+
+    def fit(self, X):
+        self._nn = NearestNeighbors(algorithm=self.algorithm, leaf_size=self.leaf_size)
+        self._nn.fit(X)
+        return self
+
+    def query(self, Q, k):
+        # Retorna (distâncias, índices), cada um (len(Q), k), em ordem crescente de distância
+        return self._nn.kneighbors(Q, n_neighbors=k)
+
+
+class RandomProjectionForest:
+    """
+    Índice aproximado: n_trees árvores de projeções aleatórias. Cada nó divide
+    os pontos pela mediana da projeção em uma direção aleatória, até folhas com
+    no máximo leaf_size pontos. A consulta desce em cada árvore até uma folha,
+    junta os candidatos de todas e calcula as distâncias exatas só para eles.
+    Mais árvores (ou folhas maiores) aumentam o recall e a latência.
+    """
+
+    def __init__(self, n_trees=8, leaf_size=64, random_state=0, block_size=1024):
+        self.n_trees = n_trees
+        self.leaf_size = leaf_size
+        self.random_state = random_state
+        self.block_size = block_size
+
+    def fit(self, X):
+        self._X = np.ascontiguousarray(X, dtype=np.float32)
+        rng = np.random.default_rng(self.random_state)
+        self._trees = [self._build_tree(rng) for _ in range(self.n_trees)]
+        return self
+
+    def _build_tree(self, rng):
+        X = self._X
+        d = X.shape[1]
+        # Nós em listas paralelas; folhas apontam para um trecho de `order`
+        dirs, thresholds, left, right, leaf_start, leaf_end = [], [], [], [], [], []
+        order = []
+
+        def new_node():
+            for lst, v in ((dirs, np.zeros(d, np.float32)), (thresholds, 0.0), (left, -1), (right, -1),
+                           (leaf_start, -1), (leaf_end, -1)):
+                lst.append(v)
+            return len(left) - 1
+
+        stack = [(new_node(), np.arange(len(X)))]
+        while stack:
+            node, idx = stack.pop()
+            if len(idx) > self.leaf_size:
+                v = rng.standard_normal(d).astype(np.float32)
+                proj = X[idx] @ v
+                threshold = np.median(proj)
+                mask = proj <= threshold
+                # Projeções todas iguais: a divisão não separa nada, vira folha
+                if 0 < mask.sum() < len(idx):
+                    dirs[node], thresholds[node] = v, threshold
+                    left[node], right[node] = new_node(), new_node()
+                    stack.append((left[node], idx[mask]))
+                    stack.append((right[node], idx[~mask]))
+                    continue
+            leaf_start[node] = len(order)
+            order.extend(idx.tolist())
+            leaf_end[node] = len(order)
+
+        return {
+            "dirs": np.array(dirs), "thresholds": np.array(thresholds, dtype=np.float32),
+            "left": np.array(left), "right": np.array(right),
+            "leaf_start": np.array(leaf_start), "leaf_end": np.array(leaf_end),
+            "order": np.array(order), "max_leaf": int(max(e - s for s, e in zip(leaf_start, leaf_end) if s >= 0)),
+        }
+
+    def _candidates(self, Q):
+        blocks = []
+        for tree in self._trees:
+            node = np.zeros(len(Q), dtype=np.int64)
+            internal = tree["left"][node] >= 0
+            while internal.any():
+                n = node[internal]
+                proj = np.einsum('ij,ij->i', Q[internal], tree["dirs"][n])
+                node[internal] = np.where(proj <= tree["thresholds"][n], tree["left"][n], tree["right"][n])
+                internal = tree["left"][node] >= 0
+            start, end = tree["leaf_start"][node], tree["leaf_end"][node]
+            offsets = np.arange(tree["max_leaf"])
+            pos = start[:, None] + offsets
+            valid = pos < end[:, None]
+            blocks.append(np.where(valid, tree["order"][np.minimum(pos, len(tree["order"]) - 1)], -1))
+        cand = np.sort(np.concatenate(blocks, axis=1), axis=1)
+        # Um ponto pode estar na folha de várias árvores: mantém uma cópia
+        cand[:, 1:][cand[:, 1:] == cand[:, :-1]] = -1
+        return cand
+
+    def query(self, Q, k):
+        Q = np.ascontiguousarray(Q, dtype=np.float32)
+        all_dist = np.empty((len(Q), k), dtype=np.float64)
+        all_idx = np.empty((len(Q), k), dtype=np.int64)
+        for lo in range(0, len(Q), self.block_size):
+            q = Q[lo:lo + self.block_size]
+            cand = self._candidates(q)
+            diff = self._X[np.maximum(cand, 0)] - q[:, None, :]
+            dist = np.einsum('ijk,ijk->ij', diff, diff)
+            dist[cand < 0] = np.inf
+            kk = min(k, dist.shape[1])
+            part = np.argpartition(dist, kk - 1, axis=1)[:, :kk]
+            part_dist = np.take_along_axis(dist, part, axis=1)
+            order = np.argsort(part_dist, axis=1, kind='stable')
+            idx = np.take_along_axis(cand, np.take_along_axis(part, order, axis=1), axis=1)
+            d = np.sqrt(np.take_along_axis(part_dist, order, axis=1))
+            # Menos candidatos que k: completa com índice -1 e distância infinita
+            if kk < k:
+                idx = np.pad(idx, ((0, 0), (0, k - kk)), constant_values=-1)
+                d = np.pad(d, ((0, 0), (0, k - kk)), constant_values=np.inf)
+            all_idx[lo:lo + len(q)] = np.where(np.isfinite(d), idx, -1)
+            all_dist[lo:lo + len(q)] = d
+        return all_dist, all_idx
+
+
+def make_index(kind='kd_tree', **params):
+    """'kd_tree', 'ball_tree' ou 'brute' (exatos) ou 'rp_forest' (aproximado)."""
+    if kind == 'rp_forest':
+        return RandomProjectionForest(**params)
+    if kind in ('kd_tree', 'ball_tree', 'brute'):
+        return ExactIndex(algorithm=kind, **params)
+    raise ValueError(f"Índice desconhecido: {kind}")
+
+
+# ===== Classificador sobre um índice =====
+
+def vote_for_ks(neighbor_classes, ks, n_classes):
+    """
+    Voto majoritário para vários k a partir de uma única consulta com k_max
+    vizinhos: contagens acumuladas por classe nos prefixos. Empates ficam com
+    a menor classe, como no KNeighborsClassifier. Retorna {k: índices de classe}.
+    """
+    onehot = np.zeros(neighbor_classes.shape + (n_classes,), dtype=np.int32)
+    valid = neighbor_classes >= 0
+    rows, cols = np.nonzero(valid)
+    onehot[rows, cols, neighbor_classes[valid]] = 1
+    counts = np.cumsum(onehot, axis=1)
+    return {k: counts[:, k - 1].argmax(axis=1) for k in ks}
+
+
+class KNNClassifier:
+    """
+    KNN com voto uniforme sobre um índice plugável (ver make_index). O índice
+    é construído uma única vez em fit; predict_for_ks responde vários k com
+    uma só consulta, para varrer k sem reconstruir nada.
+    """
+
+    def __init__(self, n_neighbors=5, index='kd_tree', **index_params):
+        self.n_neighbors = n_neighbors
+        self.index = index
+        self.index_params = index_params
+
+    def fit(self, X, y):
+        self.classes_, self._y = np.unique(y, return_inverse=True)
+        self._index = make_index(self.index, **self.index_params).fit(X)
+        return self
+
+    def kneighbors(self, X, k=None):
+        return self._index.query(X, k or self.n_neighbors)
+
+    def predict_for_ks(self, X, ks):
+        _, idx = self.kneighbors(X, max(ks))
+        neighbor_classes = np.where(idx >= 0, self._y[np.maximum(idx, 0)], -1)
+        votes = vote_for_ks(neighbor_classes, ks, len(self.classes_))
+        return {k: self.classes_[v] for k, v in votes.items()}
+
+    def predict(self, X):
+        return self.predict_for_ks(X, [self.n_neighbors])[self.n_neighbors]
+
+
+# ===== Recall x latência =====
+
+def recall_at_k(approx_idx, exact_idx):
+    k = exact_idx.shape[1]
+    hits = sum(len(np.intersect1d(a, e)) for a, e in zip(approx_idx, exact_idx))
+    return hits / (len(exact_idx) * k)
+
+
+def recall_latency(X, Q, k, configs, reference=('brute', {})):
+    """
+    Para cada (nome, tipo, parâmetros) em configs, mede o tempo de construção,
+    a latência média por consulta e o recall@k contra o índice de referência.
+    """
+    _, exact_idx = make_index(reference[0], **reference[1]).fit(X).query(Q, k)
+    rows = []
+    for name, kind, params in configs:
+        start = time.perf_counter()
+        index = make_index(kind, **params).fit(X)
+        build_time = time.perf_counter() - start
+        start = time.perf_counter()
+        _, idx = index.query(Q, k)
+        query_time = time.perf_counter() - start
+        rows.append({"indice": name, "construcao_s": build_time,
+                     "latencia_ms": 1000 * query_time / len(Q), "recall": recall_at_k(idx, exact_idx)})
+    return rows
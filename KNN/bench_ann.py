@@ -0,0 +1,62 @@
+"""
+Compara os índices de ann_index.py: recall@k x latência por consulta, e o
+custo de varrer k = 1..30 reaproveitando uma única consulta.
+
+Uso (a partir da pasta KNN):
+    python bench_ann.py                  # heart.csv replicado até 200 mil linhas
+    python bench_ann.py --linhas 2000000
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.preprocessing import StandardScaler
+
+from ann_index import KNNClassifier, recall_latency
+
+COLUMNS = ['Age', 'RestingBP', 'Cholesterol']
+
+n_rows = int(sys.argv[sys.argv.index('--linhas') + 1]) if '--linhas' in sys.argv else 200_000
+n_queries = 2000
+k = 10
+
+df = pd.read_csv("heart.csv")
+X_base = df[COLUMNS].values.astype(np.float64)
+y_base = df['HeartDisease'].values
+
+# Tabela grande sintética: linhas do heart.csv sorteadas com ruído pequeno
+rng = np.random.default_rng(0)
+pick = rng.integers(0, len(X_base), n_rows + n_queries)
+X_all = X_base[pick] + rng.normal(0, 1.0, (len(pick), X_base.shape[1]))
+y_all = y_base[pick]
+X_all = StandardScaler().fit_transform(X_all).astype(np.float32)
+X, y = X_all[:n_rows], y_all[:n_rows]
+Q = X_all[n_rows:]
+
+print(f"Base: {n_rows} linhas, {n_queries} consultas, k = {k}\n")
+
+configs = [(f"kd_tree (folha {leaf})", 'kd_tree', {"leaf_size": leaf}) for leaf in (10, 30, 100)]
+configs += [("ball_tree (folha 30)", 'ball_tree', {"leaf_size": 30})]
+configs += [(f"rp_forest ({trees} árvores)", 'rp_forest', {"n_trees": trees, "leaf_size": 64}) for trees in (1, 4, 8, 16)]
+
+print(f"{'Índice':<24} {'Construção (s)':>15} {'Latência (ms)':>14} {'Recall@k':>9}")
+for row in recall_latency(X, Q, k, configs, reference=('kd_tree', {})):
+    print(f"{row['indice']:<24} {row['construcao_s']:>15.3f} {row['latencia_ms']:>14.4f} {row['recall']:>9.3f}")
+
+# ===== Varredura de k: uma consulta com k_max contra 30 consultas =====
+k_values = list(range(1, 31))
+model = KNNClassifier(index='kd_tree', leaf_size=30).fit(X, y)
+
+start = time.perf_counter()
+sweep = model.predict_for_ks(Q, k_values)
+sweep_time = time.perf_counter() - start
+
+start = time.perf_counter()
+for kv in k_values:
+    KNeighborsClassifier(n_neighbors=kv, algorithm='kd_tree').fit(X, y).predict(Q)
+sklearn_time = time.perf_counter() - start
+
+print(f"\nVarredura k = 1..30 com um índice e uma consulta: {sweep_time:.3f} s")
+print(f"Varredura k = 1..30 com 30 KNeighborsClassifier:  {sklearn_time:.3f} s")
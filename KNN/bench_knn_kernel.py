@@ -0,0 +1,55 @@
+"""
+KNeighborsClassifier (kd_tree e brute) x BlockedKNN (knn_kernel.py): tempo de
+predição, concordância e efeito do teto de memória e do número de threads.
+
+Uso (a partir da pasta KNN):
+    python bench_knn_kernel.py                   # 200 mil linhas de treino, 20 mil consultas
+    python bench_knn_kernel.py --linhas 1000000 --k 17
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.preprocessing import StandardScaler
+
+from knn_kernel import BlockedKNN
+
+COLUMNS = ['Age', 'RestingBP', 'Cholesterol']
+
+n_rows = int(sys.argv[sys.argv.index('--linhas') + 1]) if '--linhas' in sys.argv else 200_000
+k = int(sys.argv[sys.argv.index('--k') + 1]) if '--k' in sys.argv else 17
+n_queries = 20_000
+
+df = pd.read_csv("heart.csv")
+X_base = df[COLUMNS].values.astype(np.float64)
+y_base = df['HeartDisease'].values
+
+# Linhas do heart.csv sorteadas com ruído pequeno, padronizadas como no knn.py
+rng = np.random.default_rng(0)
+pick = rng.integers(0, len(X_base), n_rows + n_queries)
+X_all = X_base[pick] + rng.normal(0, 1.0, (len(pick), X_base.shape[1]))
+X_all = StandardScaler().fit_transform(X_all)
+X, y = X_all[:n_rows], y_base[pick[:n_rows]]
+Q = X_all[n_rows:]
+
+print(f"Treino: {n_rows} linhas, {n_queries} consultas, k = {k}, {os.cpu_count()} CPU(s)\n")
+
+start = time.perf_counter()
+reference = KNeighborsClassifier(n_neighbors=k, algorithm='kd_tree').fit(X, y).predict(Q)
+print(f"{'sklearn kd_tree':<36} {time.perf_counter() - start:>8.2f} s")
+
+start = time.perf_counter()
+brute = KNeighborsClassifier(n_neighbors=k, algorithm='brute').fit(X, y).predict(Q)
+print(f"{'sklearn brute':<36} {time.perf_counter() - start:>8.2f} s   iguais ao kd_tree: {np.mean(brute == reference):.4%}")
+
+for memory_mb in (256, 32, 4):
+    for threads in sorted({1, 2, os.cpu_count() or 1}):
+        model = BlockedKNN(n_neighbors=k, memory_mb=memory_mb, n_threads=threads).fit(X, y)
+        start = time.perf_counter()
+        y_pred = model.predict(Q)
+        elapsed = time.perf_counter() - start
+        label = f"BlockedKNN ({memory_mb} MB, {threads} thread(s))"
+        print(f"{label:<36} {elapsed:>8.2f} s   iguais ao kd_tree: {np.mean(y_pred == reference):.4%}")
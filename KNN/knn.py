@@ -6,16 +6,62 @@ from sklearn.model_selection import cross_val_score, train_test_split, Stratifie
 from sklearn.metrics import accuracy_score, precision_score, recall_score, classification_report
 from sklearn.pipeline import make_pipeline
 import matplotlib.pyplot as plt
+import sys
+import time
+from pathlib import Path
+
+from ann_index import vote_for_ks
+from knn_artifact import save_artifact
+from knn_kernel import BlockedKNN
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'comum'))
+from heart_stream import load_heart, fit_scaler, predict_csv
+from model_search import search, print_table, write_table
+
+
+def cv_scores_for_ks(X, y, cv, k_values):
+    """
+    Mesmas médias de acurácia que cross_val_score(StandardScaler + KNN(k)) para
+    cada k, com um escalonamento e uma consulta de vizinhos por dobra: os votos
+    de cada k saem dos prefixos da consulta com k_max + 1 vizinhos. Quando há
+    empate de distância na fronteira do k-ésimo vizinho, quais dos empatados o
+    KNeighborsClassifier(k) usa depende do percurso da árvore; só essas linhas
+    são consultadas de novo com k vizinhos, para o resultado ser idêntico.
+    """
+    k_max = max(k_values)
+    fold_scores = []
+    for train_idx, val_idx in cv.split(X, y):
+        fold_scaler = StandardScaler().fit(X[train_idx])
+        X_fold, X_val = fold_scaler.transform(X[train_idx]), fold_scaler.transform(X[val_idx])
+        y_fold, y_val = y[train_idx], y[val_idx]
+        classes, y_codes = np.unique(y_fold, return_inverse=True)
+
+        model = KNeighborsClassifier(n_neighbors=k_max).fit(X_fold, y_fold)
+        # O vizinho extra só serve para detectar empate na fronteira de k_max
+        dist, idx = model.kneighbors(X_val, n_neighbors=min(k_max + 1, len(X_fold)))
+        votes = vote_for_ks(y_codes[idx], k_values, len(classes))
+
+        row = []
+        for k in k_values:
+            pred = votes[k]
+            if k < dist.shape[1]:
+                tied = dist[:, k - 1] == dist[:, k]
+                if tied.any():
+                    # Mesma árvore: a consulta com k vizinhos escolhe os mesmos empatados que KNN(k)
+                    tied_idx = model.kneighbors(X_val[tied], n_neighbors=k, return_distance=False)
+                    pred[tied] = vote_for_ks(y_codes[tied_idx], [k], len(classes))[k]
+            row.append(np.mean(classes[pred] == y_val))
+        fold_scores.append(row)
+    return np.mean(fold_scores, axis=0).tolist()
 
-# Carregar o dataset (substitua 'seu_dataset.csv' pelo arquivo baixado)
-df = pd.read_csv("heart.csv")
 
 # Inspecionar os dados
-print(df.head())
+print(pd.read_csv("heart.csv", nrows=5))
 
-# Pré-processar os dados (ajuste as colunas conforme necessário)
-X = df[['Age', 'RestingBP', 'Cholesterol']].values  # Insira as colunas de entrada
-y = df['HeartDisease'].values                            # Insira a coluna alvo
+# Carregar só as colunas usadas (Age, RestingBP, Cholesterol e HeartDisease), em blocos e com tipos compactos
+X, y = load_heart("heart.csv")
+# Valores inteiros: o float32 é exato, e o treino segue em float64 como antes
+X = X.astype(np.float64)
 
 # Dividir os dados em treino e teste (com estratificação e semente fixa)
 X_train, X_test, y_train, y_test = train_test_split(
@@ -27,11 +73,30 @@ k_values = list(range(1, 31))
 scores = []
 
 cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
-for k in k_values:
-    # Escalonamento dentro do CV via pipeline (evita vazamento dentro das dobras)
-    pipe = make_pipeline(StandardScaler(), KNeighborsClassifier(n_neighbors=k))
-    score = cross_val_score(pipe, X_train, y_train, cv=cv).mean()
-    scores.append(score)
+start = time.perf_counter()
+if '--pipeline' in sys.argv:
+    # Um pipeline por k: escalonamento e consulta refeitos 30 x 5 vezes
+    for k in k_values:
+        # Escalonamento dentro do CV via pipeline (evita vazamento dentro das dobras)
+        pipe = make_pipeline(StandardScaler(), KNeighborsClassifier(n_neighbors=k))
+        score = cross_val_score(pipe, X_train, y_train, cv=cv).mean()
+        scores.append(score)
+elif '--busca' in sys.argv:
+    # Módulo comum de seleção: --busca [--workers W] [--halving F]
+    workers = int(sys.argv[sys.argv.index('--workers') + 1]) if '--workers' in sys.argv else 1
+    factor = int(sys.argv[sys.argv.index('--halving') + 1]) if '--halving' in sys.argv else None
+    candidates = [(f"k={k}", [StandardScaler()], KNeighborsClassifier(n_neighbors=k)) for k in k_values]
+    table = search(candidates, X_train, y_train, cv, workers=workers, factor=factor)
+    print_table(table)
+    write_table(table, "busca_knn.csv")
+    # Eliminados pelo halving não têm média em todas as dobras: ficam fora da curva e da escolha
+    by_name = {row['candidato']: row for row in table}
+    scores = [by_name[f"k={k}"]['media'] if by_name[f"k={k}"]['dobras'] == cv.get_n_splits() else np.nan
+              for k in k_values]
+else:
+    # Varredura: escalonamento e consulta uma vez por dobra (escalonador ajustado só na dobra de treino)
+    scores = cv_scores_for_ks(X_train, y_train, cv, k_values)
+print(f"Escolha de k (CV): {time.perf_counter() - start:.3f} s")
 
 # Curva do cotovelo
 plt.figure(figsize=(10, 6))
@@ -42,17 +107,21 @@ plt.title("KNN Classifier Accuracy for Different K Values")
 plt.xticks(k_values)
 plt.savefig("output.png")
 
-best_k = k_values[int(np.argmax(scores))]
+best_k = k_values[int(np.nanargmax(scores))]
 print(f"Melhor k (CV no treino): {best_k}")
 
 # ===== Treino final no treino e avaliação no teste =====
-scaler = StandardScaler()
-X_train = scaler.fit_transform(X_train)
+scaler = fit_scaler(X_train)
+X_train = scaler.transform(X_train)
 X_test = scaler.transform(X_test)
 
 knn = KNeighborsClassifier(n_neighbors=best_k)
 knn.fit(X_train, y_train)
 
+# Salvar escalonador + treino padronizado + k (sem pickle; carregado pelo servidor de predição): --artefato knn.npz
+if '--artefato' in sys.argv:
+    save_artifact(sys.argv[sys.argv.index('--artefato') + 1], scaler, X_train, y_train, best_k)
+
 # Predição e métricas
 y_pred = knn.predict(X_test)
 
@@ -65,3 +134,18 @@ print(f"Acurácia:  {accuracy:.2f}")
 print(f"Precisão:  {precision:.2f} (binary)")
 print(f"Recall:    {recall:.2f} (binary )")
 print("\nRelatório de Classificação:\n", classification_report(y_test, y_pred, zero_division=0))
+
+# Mesmo k com o KNN só em NumPy (knn_kernel.py), com teto de memória: deve bater com o sklearn
+memory_mb = int(sys.argv[sys.argv.index('--memoria-mb') + 1]) if '--memoria-mb' in sys.argv else 256
+knn_np = BlockedKNN(n_neighbors=best_k, memory_mb=memory_mb).fit(X_train, y_train)
+y_pred_np = knn_np.predict(X_test)
+print(f"BlockedKNN ({memory_mb} MB): {np.sum(y_pred_np == y_pred)}/{len(y_pred)} predições iguais ao sklearn")
+
+# ===== Predição em fluxo de um lote grande: --pontuar entrada.csv [--saida predicoes.csv] =====
+if '--pontuar' in sys.argv:
+    path_in = sys.argv[sys.argv.index('--pontuar') + 1]
+    path_out = sys.argv[sys.argv.index('--saida') + 1] if '--saida' in sys.argv else "predicoes_knn.csv"
+    start = time.perf_counter()
+    rows = predict_csv(knn, path_in, path_out, [scaler])
+    elapsed = time.perf_counter() - start
+    print(f"Pontuadas {rows} linhas em {elapsed:.2f} s ({rows / elapsed:,.0f} linhas/s) -> {path_out}")
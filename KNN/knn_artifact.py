@@ -0,0 +1,41 @@
+"""
+Artefato do KNN final do knn.py em um .npz sem pickle: média e escala do
+StandardScaler, pontos de treino já padronizados, rótulos e k. O índice de
+vizinhos é reconstruído uma única vez, ao carregar.
+"""
+import numpy as np
+from sklearn.neighbors import KNeighborsClassifier
+
+FORMAT_VERSION = 1
+
+
+def save_artifact(path, scaler, X_train, y_train, n_neighbors):
+    """X_train já padronizado pelo `scaler`."""
+    with open(path, 'wb') as f:
+        np.savez(f, format_version=np.array(FORMAT_VERSION),
+                 scaler_mean=scaler.mean_, scaler_scale=scaler.scale_,
+                 X_train=X_train, y_train=y_train, n_neighbors=np.array(n_neighbors))
+
+
+class KNNArtifact:
+    """Escalonador + KNN do artefato; predict recebe as colunas originais."""
+
+    def __init__(self, arrays):
+        version = int(arrays['format_version'])
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Versão do artefato {version} não suportada (esperada {FORMAT_VERSION})")
+        self.scaler_mean = arrays['scaler_mean']
+        self.scaler_scale = arrays['scaler_scale']
+        self.n_neighbors = int(arrays['n_neighbors'])
+        self.model = KNeighborsClassifier(n_neighbors=self.n_neighbors).fit(arrays['X_train'], arrays['y_train'])
+
+    def transform(self, X):
+        return (np.asarray(X, dtype=np.float64) - self.scaler_mean) / self.scaler_scale
+
+    def predict(self, X):
+        return self.model.predict(self.transform(X))
+
+
+def load_artifact(path):
+    with np.load(path, allow_pickle=False) as data:
+        return KNNArtifact({name: data[name] for name in data.files})
@@ -0,0 +1,179 @@
+"""
+KNN só com NumPy, com memória controlada.
+
+As distâncias euclidianas ao quadrado saem em ladrilhos float32 do tamanho
+do cache pela identidade |a|² + |b|² - 2ab (um produto de matrizes por
+ladrilho). O primeiro ladrilho de treino escolhe os candidatos de cada
+consulta por argpartition; nos seguintes só entram, por uma fusão esparsa,
+os pontos mais próximos que o pior candidato atual (ou o argpartition de
+novo, quando eles são muitos, como em dados com empates). Os blocos de consultas
+rodam em um pool de threads (as operações do NumPy liberam o GIL), e os
+ladrilhos de todas as threads juntas cabem em `memory_mb`.
+
+O float32 só escolhe candidatos: k + `extra` por consulta, reordenados pela
+distância direta em float64, soma de (q - x)² coluna a coluna como na
+KD-tree do sklearn. Se o limite de erro do float32 não garante que todo
+vizinho verdadeiro está entre os candidatos, a consulta é refeita em float64
+contra o treino inteiro, bloco a bloco, com um top-k corrente. Distâncias iguais ficam com o menor índice de treino.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+EPS32 = float(np.finfo(np.float32).eps)
+# Ladrilho de distâncias (consultas x treino, float32) que cabe no cache L2
+TILE_BYTES = 1 << 20
+QUERY_ROWS = 64
+
+
+class BlockedKNN:
+
+    def __init__(self, n_neighbors=5, memory_mb=256, n_threads=None, extra=None):
+        self.n_neighbors = n_neighbors
+        self.memory_mb = memory_mb
+        self.n_threads = n_threads or os.cpu_count() or 1
+        # Candidatos além de k que o float32 entrega para a reordenação exata
+        self.extra = n_neighbors if extra is None else extra
+
+    def fit(self, X, y):
+        self._X = np.ascontiguousarray(X, dtype=np.float64)
+        self._X32 = self._X.astype(np.float32)
+        self._sq32 = np.einsum('ij,ij->i', self._X32, self._X32)
+        self._max_sq = float(self._sq32.max()) if len(self._X) else 0.0
+        self.classes_, self._y = np.unique(y, return_inverse=True)
+        return self
+
+    def _blocks(self, n_candidates):
+        """(linhas de consulta, linhas de treino) por bloco, dentro do teto de memória."""
+        # Pico por thread medido com tracemalloc: ~3,6 ladrilhos (busca exata dos
+        # empates; a fusão densa, com ladrilho, cópia do argpartition e índices int64, ~3,1)
+        tile = min(TILE_BYTES, self.memory_mb * 2**20 / self.n_threads / 5)
+        query_rows = QUERY_ROWS
+        train_rows = min(len(self._X), max(n_candidates, int(tile // (4 * query_rows))))
+        return query_rows, train_rows
+
+    def _exact(self, Q, idx):
+        # Mesma conta da KD-tree do sklearn: soma das diferenças ao quadrado, coluna a coluna
+        dist = np.zeros((len(Q), idx.shape[1]))
+        for j in range(Q.shape[1]):
+            diff = Q[:, j, None] - self._X[idx, j]
+            dist += diff * diff
+        return dist
+
+    def _top_k(self, dist, idx, k):
+        # Ordem por (distância, índice de treino): empates ficam com o menor índice
+        order = np.lexsort((idx, dist), axis=-1)[:, :k]
+        return np.take_along_axis(dist, order, axis=1), np.take_along_axis(idx, order, axis=1)
+
+    def _merge_dense(self, d, lo, best_d, best_i, c):
+        if d.shape[1] > c:
+            part = np.argpartition(d, c - 1, axis=1)[:, :c]
+        else:
+            part = np.broadcast_to(np.arange(d.shape[1]), (len(d), d.shape[1]))
+        block_d = np.take_along_axis(d, part, axis=1)
+        block_i = part + lo
+        if best_d is not None:
+            block_d = np.hstack([best_d, block_d])
+            block_i = np.hstack([best_i, block_i])
+        order = np.argsort(block_d, axis=1)[:, :c]
+        return np.take_along_axis(block_d, order, axis=1), np.take_along_axis(block_i, order, axis=1)
+
+    def _merge_sparse(self, d, hits, lo, best_d, best_i):
+        # Funde no lugar os poucos pontos do bloco que batem o c-ésimo melhor da linha
+        c = best_d.shape[1]
+        rows, cols = np.divmod(hits, d.shape[1])
+        touched, counts = np.unique(rows, return_counts=True)
+        m_rows = np.concatenate([np.repeat(touched, c), rows])
+        m_d = np.concatenate([best_d[touched].ravel(), d.ravel()[hits]])
+        m_i = np.concatenate([best_i[touched].ravel(), cols + lo])
+        order = np.lexsort((m_d, m_rows))
+        # Posição de cada entrada dentro da sua linha (já ordenada); ficam as c primeiras
+        sizes = counts + c
+        rank = np.arange(len(order)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        keep = order[rank < c]
+        best_d[touched] = m_d[keep].reshape(-1, c)
+        best_i[touched] = m_i[keep].reshape(-1, c)
+
+    def _query_block(self, Q, train_rows, n_candidates):
+        k, c = self.n_neighbors, n_candidates
+        Q32 = Q.astype(np.float32)
+        q_sq = np.einsum('ij,ij->i', Q32, Q32)
+        # |q|² é constante na linha e não muda a ordem: o laço usa |x|² - 2qx e soma |q|² no fim
+        Q_m2 = -2 * Q32
+        best_d = best_i = None
+        for lo in range(0, len(self._X), train_rows):
+            hi = min(lo + train_rows, len(self._X))
+            d = Q_m2 @ self._X32[lo:hi].T
+            d += self._sq32[lo:hi]
+            if best_d is not None:
+                # Só entra quem bate o c-ésimo melhor da linha: depois dos primeiros blocos, quase ninguém
+                mask = d < best_d[:, -1, None]
+                n_hits = np.count_nonzero(mask)
+                if not n_hits:
+                    continue
+                if n_hits <= mask.size // 8:
+                    self._merge_sparse(d, np.flatnonzero(mask), lo, best_d, best_i)
+                    continue
+                del mask
+            # Primeiro bloco, ou muitos candidatos (dados com empates): c melhores do bloco por argpartition
+            best_d, best_i = self._merge_dense(d, lo, best_d, best_i, c)
+        del d
+        best_d += q_sq[:, None]
+
+        dist, idx = self._top_k(self._exact(Q, best_i), best_i, k)
+
+        # Limite (folgado) do erro do float32 na distância ao quadrado
+        tol = 8 * (Q.shape[1] + 2) * EPS32 * (q_sq + self._max_sq)
+        if n_candidates < len(self._X):
+            unsafe = np.flatnonzero(best_d.max(axis=1) - tol <= dist[:, -1])
+            # Um quarto das linhas do bloco por vez: cada matriz float64 fica em meio ladrilho
+            for lo in range(0, len(unsafe), QUERY_ROWS // 4):
+                rows = unsafe[lo:lo + QUERY_ROWS // 4]
+                dist[rows], idx[rows] = self._exact_scan(Q[rows], train_rows, k)
+        return dist, idx
+
+    def _exact_scan(self, Q, train_rows, k):
+        # Raro (empates no limite): consulta em float64 contra o treino inteiro,
+        # bloco a bloco, com um top-k corrente. Os índices só crescem de um bloco
+        # para o outro, então empatar com o k-ésimo não basta para entrar, e a
+        # ordenação estável mantém o menor índice entre distâncias iguais
+        best_d = np.full((len(Q), k), np.inf)
+        best_i = np.zeros((len(Q), k), dtype=np.int64)
+        for lo in range(0, len(self._X), train_rows):
+            block_idx = np.arange(lo, min(lo + train_rows, len(self._X)))
+            block_d = self._exact(Q, block_idx[None, :])
+            rows = np.flatnonzero((block_d < best_d[:, -1, None]).any(axis=1))
+            if not rows.size:
+                continue
+            merged_d = np.hstack([best_d[rows], block_d[rows]])
+            merged_i = np.hstack([best_i[rows], np.broadcast_to(block_idx, (len(rows), len(block_idx)))])
+            order = np.argsort(merged_d, axis=1, kind='stable')[:, :k]
+            best_d[rows] = np.take_along_axis(merged_d, order, axis=1)
+            best_i[rows] = np.take_along_axis(merged_i, order, axis=1)
+        return best_d, best_i
+
+    def kneighbors(self, X):
+        """(distâncias, índices) dos k vizinhos, em ordem crescente de distância."""
+        Q = np.ascontiguousarray(X, dtype=np.float64)
+        k = self.n_neighbors
+        n_candidates = min(len(self._X), k + self.extra)
+        query_rows, train_rows = self._blocks(n_candidates)
+        starts = range(0, len(Q), query_rows)
+        run = lambda lo: self._query_block(Q[lo:lo + query_rows], train_rows, n_candidates)
+        if self.n_threads > 1 and len(starts) > 1:
+            with ThreadPoolExecutor(max_workers=self.n_threads) as pool:
+                parts = list(pool.map(run, starts))
+        else:
+            parts = [run(lo) for lo in starts]
+        if not parts:
+            return np.empty((0, k)), np.empty((0, k), dtype=np.int64)
+        dist = np.concatenate([p[0] for p in parts])
+        idx = np.concatenate([p[1] for p in parts])
+        return np.sqrt(dist), idx
+
+    def predict(self, X):
+        _, idx = self.kneighbors(X)
+        votes = (self._y[idx][:, :, None] == np.arange(len(self.classes_))).sum(axis=1)
+        # argmax fica com a menor classe nos empates, como o KNeighborsClassifier
+        return self.classes_[votes.argmax(axis=1)]
@@ -0,0 +1,41 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+from sklearn.neighbors import KNeighborsClassifier
+
+from knn_kernel import BlockedKNN
+
+
+def duplicated_rows(n_train=150_000, n_query=128, seed=0):
+    # Poucos pontos inteiros repetidos: quase toda consulta empata no k-ésimo vizinho
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 20, (300, 3)).astype(np.float64)
+    X = base[rng.integers(0, len(base), n_train)]
+    y = rng.integers(0, 2, n_train)
+    return X, y, base[rng.integers(0, len(base), n_query)]
+
+
+@pytest.mark.parametrize('memory_mb, n_threads', [(4, 1), (2, 2)])
+def test_peak_memory_within_ceiling_with_ties(memory_mb, n_threads):
+    X, y, Q = duplicated_rows()
+    model = BlockedKNN(n_neighbors=17, memory_mb=memory_mb, n_threads=n_threads).fit(X, y)
+
+    tracemalloc.start()
+    try:
+        dist, idx = model.kneighbors(Q)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak <= memory_mb * 2**20
+    reference = KNeighborsClassifier(n_neighbors=17, algorithm='brute').fit(X, y).kneighbors(Q)[0]
+    np.testing.assert_allclose(dist, reference)
+
+
+def test_ties_keep_lowest_training_index():
+    X, y, Q = duplicated_rows(n_train=20_000, n_query=8)
+    _, idx = BlockedKNN(n_neighbors=17, memory_mb=1, n_threads=1).fit(X, y).kneighbors(Q)
+    for q, row in zip(Q, idx):
+        sq = ((X - q) ** 2).sum(axis=1)
+        np.testing.assert_array_equal(row, np.lexsort((np.arange(len(X)), sq))[:17])
@@ -0,0 +1,63 @@
+"""
+SVC exato (RBF) x KernelApproxSVM: tempo de treino, de predição e acurácia
+no teste, para tamanhos crescentes de treino sintético no formato do heart.csv.
+
+Uso (a partir da pasta SVM):
+    python bench_svm.py                          # 2 mil, 20 mil e 200 mil linhas
+    python bench_svm.py --linhas 1000000 --max-exato 10000
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+from fast_svm import KernelApproxSVM
+
+COLUMNS = ['Age', 'RestingBP', 'Cholesterol']
+
+sizes = ([int(sys.argv[sys.argv.index('--linhas') + 1])] if '--linhas' in sys.argv
+         else [2_000, 20_000, 200_000])
+# Acima disso o SVC exato leva minutos (O(n²) a O(n³))
+max_exact = int(sys.argv[sys.argv.index('--max-exato') + 1]) if '--max-exato' in sys.argv else 20_000
+n_test = 20_000
+
+df = pd.read_csv("heart.csv")
+X_base = df[COLUMNS].values.astype(np.float64)
+y_base = df['HeartDisease'].values
+rng = np.random.default_rng(0)
+
+
+def sample(n):
+    # Linhas do heart.csv sorteadas com ruído pequeno
+    pick = rng.integers(0, len(X_base), n)
+    return X_base[pick] + rng.normal(0, 1.0, (n, X_base.shape[1])), y_base[pick]
+
+
+X_test, y_test = sample(n_test)
+models = [
+    ("SVC exato (rbf, cache 200 MB)", lambda: SVC(kernel='rbf', gamma='scale', cache_size=200)),
+    ("RFF 300 + SGD", lambda: KernelApproxSVM('rff', 300, solver='sgd')),
+    ("RFF 300 + dual (liblinear)", lambda: KernelApproxSVM('rff', 300, solver='dcd')),
+    ("Nyström 300 + SGD", lambda: KernelApproxSVM('nystroem', 300, solver='sgd')),
+    ("Nyström 300 + dual (liblinear)", lambda: KernelApproxSVM('nystroem', 300, solver='dcd')),
+]
+
+print(f"{'Linhas':>8} {'Modelo':<32} {'Treino (s)':>11} {'Predição (s)':>13} {'Acurácia':>9}")
+for n in sizes:
+    X_train, y_train = sample(n)
+    scaler = StandardScaler().fit(X_train)
+    A, B = scaler.transform(X_train), scaler.transform(X_test)
+    for name, make in models:
+        if name.startswith("SVC") and n > max_exact:
+            print(f"{n:>8} {name:<32} {'(pulado)':>11}")
+            continue
+        start = time.perf_counter()
+        model = make().fit(A, y_train)
+        fit_time = time.perf_counter() - start
+        start = time.perf_counter()
+        y_pred = model.predict(B)
+        predict_time = time.perf_counter() - start
+        print(f"{n:>8} {name:<32} {fit_time:>11.2f} {predict_time:>13.3f} {np.mean(y_pred == y_test):>9.3f}")
@@ -5,22 +5,45 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 from sklearn.svm import SVC
 from sklearn.metrics import accuracy_score
-import pandas as pd
+import sys
+import time
+from pathlib import Path
 
-# Carregar o conjunto de dados Iris
-data = pd.read_csv("heart.csv")
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'comum'))
+from heart_stream import load_heart, fit_scaler, predict_csv
+from model_search import search, print_table, write_table
 
-# Pré-processar os dados (ajuste as colunas conforme necessário)
-X = data[['Age', 'RestingBP', 'Cholesterol']].values  # Insira as colunas de entrada
-y = data['HeartDisease'].values                            # Insira a coluna alvo
+# Carregar só as colunas usadas (Age, RestingBP, Cholesterol e HeartDisease), em blocos e com tipos compactos
+X, y = load_heart("heart.csv")
+# Valores inteiros: o float32 é exato, e o treino segue em float64 como antes
+X = X.astype(np.float64)
 
 # Dividir os dados em conjuntos de treinamento e teste
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.25
                                                     , random_state=42)
 
+# parametros do SVM final; com --busca, os do melhor candidato
+svm_params = {'kernel': 'poly'}
+
+# busca de kernel e C com o modulo comum, escalonador e PCA ajustados por dobra: --busca [--workers W] [--halving F]
+if '--busca' in sys.argv:
+    from sklearn.model_selection import StratifiedKFold
+    workers = int(sys.argv[sys.argv.index('--workers') + 1]) if '--workers' in sys.argv else 1
+    factor = int(sys.argv[sys.argv.index('--halving') + 1]) if '--halving' in sys.argv else None
+    grid = {f'{kernel} C={C}': {'kernel': kernel, 'C': C}
+            for kernel in ('linear', 'poly', 'rbf', 'sigmoid') for C in (0.1, 1, 10)}
+    candidates = [(name, [StandardScaler(), PCA(n_components=3)], SVC(**params)) for name, params in grid.items()]
+    cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
+    table = search(candidates, X_train, y_train, cv, workers=workers, factor=factor)
+    print_table(table)
+    write_table(table, 'busca_svm.csv')
+    # a tabela vem com o melhor primeiro: ele e reajustado no treino inteiro logo abaixo
+    svm_params = grid[table[0]['candidato']]
+    print(f"\nMelhor candidato (CV no treino): {table[0]['candidato']}\n")
+
 # Padronizar os dados (muito importante para PCA e SVM)
-scaler = StandardScaler()
-X_train = scaler.fit_transform(X_train)
+scaler = fit_scaler(X_train)
+X_train = scaler.transform(X_train)
 X_test = scaler.transform(X_test)
 
 # Aplicar PCA para reduzir a dimensionalidade
@@ -29,7 +52,7 @@ X_train_pca = pca.fit_transform(X_train)
 X_test_pca = pca.transform(X_test)
 
 # Treinar o modelo SVM
-svm = SVC(kernel='poly')  # Você pode escolher outros kernels como 'rbf'
+svm = SVC(**svm_params)  # kernel poly por padrao; --busca escolhe kernel e C
 svm.fit(X_train_pca, y_train)
 
 # Fazer previsões no conjunto de teste
@@ -39,14 +62,17 @@ y_pred = svm.predict(X_test_pca)
 accuracy = accuracy_score(y_test, y_pred)
 print(f'Acurácia: {accuracy:.2f}')
 
-import pickle
-# Save the model to a file
-with open('svm.model', 'wb') as file:
-  pickle.dump(svm, file)
+# salvar escalonador + PCA + SVM em um artefato (so arrays NumPy, sem pickle) para o serve.py: --artefato svm.npz
+if '--artefato' in sys.argv:
+    from svm_artifact import save_artifact, load_artifact
+    path_artifact = sys.argv[sys.argv.index('--artefato') + 1]
+    save_artifact(path_artifact, scaler, pca, svm)
 
-# Load the model from the file
-with open('svm.model', 'rb') as file:
-  svm = pickle.load(file)
+    # carregar o pipeline inteiro do artefato: arrays mapeados do arquivo, preditor so com NumPy
+    start = time.perf_counter()
+    svm_artifact = load_artifact(path_artifact)
+    print(f'Artefato {path_artifact} carregado em {(time.perf_counter() - start) * 1000:.2f} ms '
+          f'({len(svm_artifact.support_vectors)} vetores de suporte)')
   
   
 # treinar o model com cross-validation
@@ -59,3 +85,32 @@ print(f'Mean cross-validation score: {np.mean(scores):.2f}')
 y_pred_cv = svm_cv.fit(X_train_pca, y_train).predict(X_test_pca)
 accuracy_cv = accuracy_score(y_test, y_pred_cv)
 print(f'Acurácia com cross-validation: {accuracy_cv:.2f}')
+
+# treino rapido para muitas linhas: kernel RBF aproximado + SVM linear (ver fast_svm.py)
+# uso: --rapido [--aprox rff|nystroem] [--solver sgd|dcd]
+if '--rapido' in sys.argv:
+    from fast_svm import KernelApproxSVM, cross_val_approx
+    approx = sys.argv[sys.argv.index('--aprox') + 1] if '--aprox' in sys.argv else 'rff'
+    solver = sys.argv[sys.argv.index('--solver') + 1] if '--solver' in sys.argv else 'sgd'
+
+    start = time.perf_counter()
+    scores = cross_val_score(SVC(kernel='rbf', gamma='scale'), X_train_pca, y_train, cv=5)
+    exact_time = time.perf_counter() - start
+
+    svm_fast = KernelApproxSVM(approx=approx, solver=solver)
+    start = time.perf_counter()
+    scores_fast = cross_val_approx(svm_fast, X_train_pca, y_train, cv=5)
+    fast_time = time.perf_counter() - start
+    accuracy_fast = accuracy_score(y_test, svm_fast.fit(X_train_pca, y_train).predict(X_test_pca))
+
+    print(f'\nSVC exato (rbf):        CV {np.mean(scores):.2f} em {exact_time:.3f} s, teste {accuracy_cv:.2f}')
+    print(f'Aproximado ({approx} + {solver}): CV {np.mean(scores_fast):.2f} em {fast_time:.3f} s, teste {accuracy_fast:.2f}')
+
+# predicao em fluxo de um lote grande com o modelo em memoria: --pontuar entrada.csv [--saida predicoes.csv]
+if '--pontuar' in sys.argv:
+    path_in = sys.argv[sys.argv.index('--pontuar') + 1]
+    path_out = sys.argv[sys.argv.index('--saida') + 1] if '--saida' in sys.argv else 'predicoes_svm.csv'
+    start = time.perf_counter()
+    rows = predict_csv(svm, path_in, path_out, [scaler, pca])
+    elapsed = time.perf_counter() - start
+    print(f'Pontuadas {rows} linhas em {elapsed:.2f} s ({rows / elapsed:,.0f} linhas/s) -> {path_out}')
@@ -0,0 +1,135 @@
+"""
+Artefato versionado do pipeline do svm.py (StandardScaler -> PCA -> SVC) em
+um único .npz não comprimido, só com arrays NumPy (sem pickle).
+
+O preditor usa apenas NumPy: um processo de pontuação não precisa importar o
+sklearn. Como os membros do .npz ficam gravados sem compressão, load_artifact
+mapeia cada array direto do arquivo (np.memmap), sem copiá-lo para a memória.
+"""
+import struct
+import zipfile
+
+import numpy as np
+
+FORMAT_VERSION = 1
+KERNELS = ('linear', 'poly', 'rbf', 'sigmoid')
+
+
+def save_artifact(path, scaler, pca, svm):
+    """Grava os parâmetros ajustados do escalonador, do PCA e do SVC (binário) em `path`."""
+    if svm.kernel not in KERNELS:
+        raise ValueError(f"Kernel não suportado no artefato: {svm.kernel}")
+    if len(svm.classes_) != 2:
+        raise ValueError("O artefato só guarda SVC binário")
+    with open(path, 'wb') as f:
+        np.savez(
+            f,
+            format_version=np.array(FORMAT_VERSION),
+            scaler_mean=scaler.mean_, scaler_scale=scaler.scale_,
+            pca_mean=pca.mean_, pca_components=pca.components_,
+            # Branqueamento do PCA: divide por sqrt(variância); 1 quando desligado
+            pca_scale=np.sqrt(pca.explained_variance_) if pca.whiten else np.ones(pca.n_components_),
+            kernel=np.array(svm.kernel),
+            # _gamma é o gamma já resolvido ('scale'/'auto' viram número no fit)
+            gamma=np.array(svm._gamma), coef0=np.array(svm.coef0), degree=np.array(svm.degree),
+            support_vectors=svm.support_vectors_, dual_coef=svm.dual_coef_.ravel(),
+            intercept=svm.intercept_, classes=svm.classes_,
+        )
+
+
+def _mmap_npz(path):
+    """Mapeia cada membro não comprimido do .npz direto do arquivo."""
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Membro comprimido no artefato: {info.filename}")
+            # Cabeçalho local do zip: 30 bytes + nome + campo extra, depois o .npy
+            f.seek(info.header_offset)
+            name_len, extra_len = struct.unpack('<HH', f.read(30)[26:30])
+            f.seek(info.header_offset + 30 + name_len + extra_len)
+            version = np.lib.format.read_magic(f)
+            read_header = (np.lib.format.read_array_header_1_0 if version == (1, 0)
+                           else np.lib.format.read_array_header_2_0)
+            shape, fortran, dtype = read_header(f)
+            if dtype.hasobject:
+                raise ValueError(f"Array de objetos no artefato: {info.filename}")
+            name = info.filename[:-len('.npy')]
+            if int(np.prod(shape)) == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(f, dtype=dtype, mode='r', offset=f.tell(), shape=shape,
+                                         order='F' if fortran else 'C')
+    return arrays
+
+
+def _powi(base, degree):
+    # Potência inteira por quadrados, como o powi do libsvm; np.power com
+    # expoente inteiro cai no pow() genérico e fica ~20x mais lento
+    result = np.ones_like(base)
+    while degree:
+        if degree & 1:
+            result *= base
+        degree >>= 1
+        if degree:
+            base = base * base
+    return result
+
+
+class SVMArtifact:
+    """Preditor do pipeline gravado por save_artifact, só com NumPy."""
+
+    def __init__(self, arrays):
+        # np.asarray: visão ndarray simples do memmap (sem cópia e sem o custo da subclasse)
+        arrays = {name: np.asarray(value) for name, value in arrays.items()}
+        version = int(arrays['format_version'])
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Versão do artefato {version} não suportada (esperada {FORMAT_VERSION})")
+        self.scaler_mean = arrays['scaler_mean']
+        self.scaler_scale = arrays['scaler_scale']
+        self.pca_mean = arrays['pca_mean']
+        self.pca_components = arrays['pca_components']
+        self.pca_scale = arrays['pca_scale']
+        self.kernel = str(arrays['kernel'][()])
+        self.gamma = float(arrays['gamma'])
+        self.coef0 = float(arrays['coef0'])
+        self.degree = int(arrays['degree'])
+        self.support_vectors = arrays['support_vectors']
+        self.dual_coef = arrays['dual_coef']
+        self.intercept = float(arrays['intercept'][0])
+        self.classes = np.asarray(arrays['classes'])
+        self._sv_sq_norms = np.einsum('ij,ij->i', self.support_vectors, self.support_vectors)
+
+    def transform(self, X):
+        X = (np.asarray(X, dtype=np.float64) - self.scaler_mean) / self.scaler_scale
+        return ((X - self.pca_mean) @ self.pca_components.T) / self.pca_scale
+
+    def _kernel(self, Z):
+        dots = Z @ self.support_vectors.T
+        if self.kernel == 'linear':
+            return dots
+        if self.kernel == 'poly':
+            return _powi(self.gamma * dots + self.coef0, self.degree)
+        if self.kernel == 'sigmoid':
+            return np.tanh(self.gamma * dots + self.coef0)
+        sq_dist = np.einsum('ij,ij->i', Z, Z)[:, None] + self._sv_sq_norms - 2 * dots
+        return np.exp(-self.gamma * np.maximum(sq_dist, 0))
+
+    def decision_function(self, X, block_size=4096):
+        """Mesmo sinal do SVC.decision_function; blocos limitam a matriz de kernel."""
+        Z = self.transform(X)
+        out = np.empty(len(Z))
+        for lo in range(0, len(Z), block_size):
+            out[lo:lo + block_size] = self._kernel(Z[lo:lo + block_size]) @ self.dual_coef + self.intercept
+        return out
+
+    def predict(self, X):
+        return self.classes[(self.decision_function(X) > 0).astype(int)]
+
+
+def load_artifact(path, mmap=True):
+    """SVMArtifact de `path`; com mmap=False os arrays são lidos para a memória (np.load)."""
+    if mmap:
+        return SVMArtifact(_mmap_npz(path))
+    with np.load(path, allow_pickle=False) as data:
+        return SVMArtifact({name: data[name] for name in data.files})
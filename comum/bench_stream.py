@@ -0,0 +1,91 @@
+"""
+Vazão (linhas/s) da leitura em blocos, do escalonador com partial_fit e da
+predição em fluxo, sobre um lote sintético no formato do heart.csv.
+
+Uso (a partir da pasta comum):
+    python bench_stream.py                   # 1 milhão de linhas
+    python bench_stream.py --linhas 20000000 --bloco 200000
+"""
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import PCA
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+from heart_stream import FEATURES, load_heart, fit_scaler, predict_csv, read_chunks
+
+HEART = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'KNN', 'heart.csv')
+
+n_rows = int(sys.argv[sys.argv.index('--linhas') + 1]) if '--linhas' in sys.argv else 1_000_000
+chunksize = int(sys.argv[sys.argv.index('--bloco') + 1]) if '--bloco' in sys.argv else 100_000
+
+
+def peak_rss_mb():
+    # ru_maxrss em KiB no Linux: pico do processo até aqui
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def report(label, rows, seconds):
+    print(f"{label:<34} {seconds:>8.2f} s {rows / seconds:>14,.0f} linhas/s   pico RSS {peak_rss_mb():>7.0f} MB")
+
+
+# Lote sintético: linhas do heart.csv sorteadas, com todas as 12 colunas
+base = pd.read_csv(HEART)
+rng = np.random.default_rng(0)
+tmp = tempfile.mkdtemp()
+batch_path = os.path.join(tmp, 'lote.csv')
+with open(batch_path, 'w', newline='') as f:
+    for lo in range(0, n_rows, chunksize):
+        part = base.iloc[rng.integers(0, len(base), min(chunksize, n_rows - lo))]
+        part.to_csv(f, header=(lo == 0), index=False)
+print(f"Lote: {n_rows:,} linhas, {os.path.getsize(batch_path) / 2**20:.0f} MB, blocos de {chunksize:,}\n")
+
+# Modelos treinados no heart.csv, como nos scripts
+X, y = load_heart(HEART)
+X = X.astype(np.float64)
+scaler = StandardScaler().fit(X)
+knn = KNeighborsClassifier(n_neighbors=17).fit(scaler.transform(X), y)
+pca = PCA(n_components=3).fit(scaler.transform(X))
+svm = SVC(kernel='poly').fit(pca.transform(scaler.transform(X)), y)
+
+# ===== Em fluxo (antes da leitura inteira, para o pico de memória valer) =====
+start = time.perf_counter()
+rows = sum(len(Xc) for Xc, _ in read_chunks(batch_path, chunksize))
+report("Leitura em blocos (3 colunas)", rows, time.perf_counter() - start)
+
+start = time.perf_counter()
+stream_scaler = fit_scaler(batch_path, chunksize)
+report("Escalonador (partial_fit)", stream_scaler.n_samples_seen_, time.perf_counter() - start)
+
+out_path = os.path.join(tmp, 'predicoes.csv')
+start = time.perf_counter()
+rows = predict_csv(knn, batch_path, out_path, [scaler], chunksize)
+report("Predição em fluxo (KNN, k = 17)", rows, time.perf_counter() - start)
+
+start = time.perf_counter()
+rows = predict_csv(svm, batch_path, out_path, [scaler, pca], chunksize)
+report("Predição em fluxo (PCA + SVM)", rows, time.perf_counter() - start)
+
+# ===== Referência: pd.read_csv do arquivo inteiro =====
+start = time.perf_counter()
+df = pd.read_csv(batch_path)
+X_full = df[FEATURES].values
+report("pd.read_csv inteiro (12 colunas)", len(df), time.perf_counter() - start)
+print(f"\nDataFrame inteiro: {df.memory_usage(deep=True).sum() / 2**20:.0f} MB; "
+      f"bloco compacto: {chunksize * len(FEATURES) * 4 / 2**20:.1f} MB")
+
+full_scaler = StandardScaler().fit(X_full)
+print(f"Diferença máxima média/escala (partial_fit x fit): "
+      f"{np.abs(stream_scaler.mean_ - full_scaler.mean_).max():.2e} / "
+      f"{np.abs(stream_scaler.scale_ - full_scaler.scale_).max():.2e}")
+
+os.remove(batch_path)
+os.remove(out_path)
+os.rmdir(tmp)
@@ -0,0 +1,76 @@
+"""
+Leitura em blocos de arquivos no formato do heart.csv e predição em fluxo.
+
+Só as colunas usadas são lidas, com tipos compactos (float32/int8), e a
+memória fica limitada pelo tamanho do bloco, não pelo tamanho do arquivo:
+serve tanto para o heart.csv quanto para lotes de vários GB a pontuar.
+"""
+import numpy as np
+import pandas as pd
+
+FEATURES = ['Age', 'RestingBP', 'Cholesterol']
+TARGET = 'HeartDisease'
+# Idade, pressão e colesterol são inteiros pequenos: float32 os representa sem perda
+DTYPES = {**{c: np.float32 for c in FEATURES}, TARGET: np.int8}
+CHUNKSIZE = 100_000
+
+
+def read_chunks(path, chunksize=CHUNKSIZE, target=True):
+    """Gera (X float32, y int8) por bloco de até `chunksize` linhas; y é None se target=False."""
+    columns = FEATURES + [TARGET] if target else FEATURES
+    with pd.read_csv(path, usecols=columns, dtype={c: DTYPES[c] for c in columns},
+                     chunksize=chunksize) as reader:
+        for chunk in reader:
+            X = chunk[FEATURES].to_numpy(dtype=np.float32)
+            y = chunk[TARGET].to_numpy() if target else None
+            yield X, y
+
+
+def load_heart(path, chunksize=CHUNKSIZE):
+    """Arquivo inteiro em memória, mas já compacto: X (n, 3) float32 e y (n,) int8."""
+    X_parts, y_parts = [], []
+    for X, y in read_chunks(path, chunksize):
+        X_parts.append(X)
+        y_parts.append(y)
+    return np.concatenate(X_parts), np.concatenate(y_parts)
+
+
+def fit_scaler(source, chunksize=CHUNKSIZE, scaler=None):
+    """
+    StandardScaler ajustado em uma passada, bloco a bloco, com partial_fit
+    (média e variância combinadas incrementalmente em float64). `source` é o
+    caminho de um arquivo no formato do heart.csv ou uma matriz já em memória
+    (como o treino de knn.py e svm.py); com um único bloco, o resultado é o
+    mesmo de StandardScaler().fit.
+    """
+    # Import local: quem só pontua (predict_csv com o preditor NumPy do SVM) não carrega o sklearn
+    from sklearn.preprocessing import StandardScaler
+
+    scaler = scaler or StandardScaler()
+    if isinstance(source, np.ndarray):
+        blocks = (source[lo:lo + chunksize] for lo in range(0, len(source), chunksize))
+    else:
+        blocks = (X for X, _ in read_chunks(source, chunksize, target=False))
+    for X in blocks:
+        scaler.partial_fit(X)
+    return scaler
+
+
+def predict_csv(model, path_in, path_out, transforms=(), chunksize=CHUNKSIZE):
+    """
+    Pontua `path_in` bloco a bloco: aplica os `transforms` (escalonador, PCA...)
+    e model.predict, e acrescenta as predições em `path_out` (uma coluna
+    HeartDisease). A coluna alvo, se existir na entrada, é ignorada. Retorna o
+    número de linhas pontuadas.
+    """
+    rows = 0
+    with open(path_out, 'w', newline='') as out:
+        out.write(f"{TARGET}\n")
+        for X, _ in read_chunks(path_in, chunksize, target=False):
+            # Os modelos dos scripts são treinados em float64
+            X = X.astype(np.float64)
+            for step in transforms:
+                X = step.transform(X)
+            np.savetxt(out, model.predict(X), fmt='%d')
+            rows += len(X)
+    return rows
@@ -0,0 +1,87 @@
+"""
+Gerador de carga para serve.py: `conexoes` clientes keep-alive simultâneos,
+cada um mandando pedidos de `linhas` linhas sorteadas do heart.csv. Mede a
+latência vista pelo cliente e, no fim, mostra as métricas do servidor.
+
+Uso (a partir da pasta comum, com o servidor no ar):
+    python load_client.py --conexoes 32 --requisicoes 5000 --linhas 1
+    python load_client.py --unix /tmp/heart.sock --segundos 10
+"""
+import asyncio
+import json
+import time
+
+import numpy as np
+
+from heart_stream import load_heart
+from serve import ROOT, Histogram, arg
+
+
+async def open_connection(host, port, unix):
+    if unix:
+        return await asyncio.open_unix_connection(unix)
+    return await asyncio.open_connection(host, port)
+
+
+async def http_request(reader, writer, method, path, payload=None):
+    body = b'' if payload is None else json.dumps(payload).encode()
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def worker(address, X, rows_per_request, deadline, remaining, latency, rng):
+    reader, writer = await open_connection(*address)
+    try:
+        while remaining[0] > 0 and time.perf_counter() < deadline:
+            remaining[0] -= 1
+            batch = X[rng.integers(0, len(X), rows_per_request)].tolist()
+            start = time.perf_counter()
+            status, response = await http_request(reader, writer, 'POST', '/predict', batch)
+            latency.add(time.perf_counter() - start)
+            if status != 200 or len(response['predicoes']) != rows_per_request:
+                raise RuntimeError(f"Resposta inesperada ({status}): {response}")
+    finally:
+        writer.close()
+
+
+async def main():
+    address = (arg('--host', '127.0.0.1'), int(arg('--porta', 8765)), arg('--unix', None))
+    connections = int(arg('--conexoes', 16))
+    rows_per_request = int(arg('--linhas', 1))
+    remaining = [int(arg('--requisicoes', 2000))]
+    deadline = time.perf_counter() + float(arg('--segundos', 'inf'))
+
+    X, _ = load_heart(ROOT / 'KNN' / 'heart.csv')
+    latency = Histogram()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(address, X, rows_per_request, deadline, remaining, latency,
+                                  np.random.default_rng(i)) for i in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    summary = latency.summary()
+    print(f"Cliente: {summary['n']} requisições x {rows_per_request} linha(s), {connections} conexões, {elapsed:.2f} s")
+    print(f"  vazão: {summary['n'] / elapsed:,.0f} req/s, {summary['n'] * rows_per_request / elapsed:,.0f} linhas/s")
+    print("  latência (ms): " + ", ".join(f"{k} {summary[k] * 1000:.3f}" for k in ('p50', 'p90', 'p99', 'max')))
+
+    reader, writer = await open_connection(*address)
+    _, metrics = await http_request(reader, writer, 'GET', '/metrics')
+    writer.close()
+    server_latency, batch = metrics['latencia_s'], metrics['linhas_por_lote']
+    print(f"Servidor: {metrics['requisicoes']} requisições em {metrics['lotes']} lotes "
+          f"(média {batch['media']:.1f} linhas/lote, p99 {batch['p99']:.0f}), {metrics['erros']} erros")
+    print("  latência (ms): " + ", ".join(f"{k} {server_latency[k] * 1000:.3f}" for k in ('p50', 'p90', 'p99', 'max')))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,165 @@
+"""
+Seleção de modelos compartilhada por knn.py e svm.py.
+
+Cada candidato é (nome, passos de pré-processamento, estimador), e cada
+avaliação é um par (candidato, dobra), executado em um pool de processos.
+O pré-processamento de uma dobra (ex.: StandardScaler + PCA) é guardado em
+disco com joblib.Memory, indexado por uma impressão digital de X e y
+(calculada uma vez por busca), pelos índices da dobra e pelos parâmetros dos
+passos: os 30 valores de k do KNN, ou os kernels do SVM, ajustam o
+escalonador uma vez por dobra, e uma nova execução reaproveita o cache. O
+cache fica na pasta comum/.cache_dobras (ou em `cache_dir`); apagar a pasta
+o limpa.
+Com successive halving as dobras são o recurso: todos os candidatos rodam
+nas primeiras dobras e só a melhor fração segue para as seguintes.
+"""
+import csv
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from joblib import Memory, hash as joblib_hash
+from sklearn.base import clone
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_dobras')
+
+COLUMNS = ['candidato', 'dobras', 'media', 'desvio', 'preprocess_s', 'treino_s', 'predicao_s', 'eliminado_na_rodada']
+
+# Dados da busca em cada processo (definidos por _init_worker)
+_X = _y = _folds = _data_key = _preprocess = None
+
+
+def preprocess_fold(steps, X, y, train_idx, val_idx):
+    """Ajusta cópias dos passos na parte de treino da dobra e transforma treino e validação."""
+    X_train, X_val = X[train_idx], X[val_idx]
+    for step in steps:
+        step = clone(step)
+        X_train = step.fit_transform(X_train, y[train_idx])
+        X_val = step.transform(X_val)
+    return X_train, X_val
+
+
+def _preprocess_fold_keyed(steps, data_key, X, y, train_idx, val_idx):
+    # Versão para o cache: X e y ficam fora da chave, representados por data_key
+    return preprocess_fold(steps, X, y, train_idx, val_idx)
+
+
+def _init_worker(X, y, folds, cache_dir, data_key):
+    global _X, _y, _folds, _data_key, _preprocess
+    _X, _y, _folds, _data_key = X, y, folds, data_key
+    _preprocess = (Memory(cache_dir, verbose=0).cache(_preprocess_fold_keyed, ignore=['X', 'y'])
+                   if cache_dir else _preprocess_fold_keyed)
+
+
+def _evaluate(candidate, fold):
+    name, steps, model = candidate
+    train_idx, val_idx = _folds[fold]
+
+    start = time.perf_counter()
+    X_train, X_val = _preprocess(list(steps), _data_key, _X, _y, train_idx, val_idx)
+    preprocess_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    estimator = clone(model).fit(X_train, _y[train_idx])
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score = estimator.score(X_val, _y[val_idx])
+    score_time = time.perf_counter() - start
+    return name, fold, score, preprocess_time, fit_time, score_time
+
+
+def _mean(entry):
+    return np.mean([entry['scores'][f] for f in sorted(entry['scores'])])
+
+
+def _pool(workers, initargs):
+    # fork evita reexecutar o script principal (knn.py/svm.py não têm guarda de __main__)
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork') if 'fork' in methods else None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=_init_worker, initargs=initargs)
+
+
+def search(candidates, X, y, cv, workers=1, factor=None, min_folds=1, cache_dir=CACHE_DIR):
+    """
+    Avalia os candidatos nas dobras de cv (acurácia de estimator.score) e
+    devolve a tabela, uma linha (dict com COLUMNS) por candidato, melhor
+    primeiro: os que passaram por todas as dobras, por média decrescente, e
+    depois os eliminados. Empates mantêm a ordem de `candidates`.
+    Sem `factor`, todos rodam em todas as dobras. Com factor = f, a rodada 0
+    usa `min_folds` dobras, cada rodada seguinte multiplica as dobras por f e
+    só o 1/f melhor dos candidatos continua, até usar todas.
+    cache_dir=None desliga o cache em disco.
+    """
+    folds = list(cv.split(X, y))
+    by_name = {c[0]: c for c in candidates}
+    stats = {name: {'scores': {}, 'preprocess_s': 0.0, 'treino_s': 0.0, 'predicao_s': 0.0,
+                    'eliminado_na_rodada': None} for name in by_name}
+
+    alive = list(by_name)
+    done, budget = 0, len(folds) if factor is None else min(min_folds, len(folds))
+    data_key = joblib_hash((X, y)) if cache_dir else None
+    initargs = (X, y, folds, cache_dir, data_key)
+    pool = _pool(workers, initargs) if workers > 1 else None
+    if pool is None:
+        _init_worker(*initargs)
+
+    try:
+        rung = 0
+        while True:
+            # Dobra por dobra: candidatos com os mesmos passos acertam o cache da mesma dobra
+            tasks = [(by_name[name], fold) for fold in range(done, budget) for name in alive]
+            if pool is None:
+                results = (_evaluate(*task) for task in tasks)
+            else:
+                results = pool.map(_evaluate, *zip(*tasks)) if tasks else []
+            for name, fold, score, preprocess_time, fit_time, score_time in results:
+                entry = stats[name]
+                entry['scores'][fold] = score
+                entry['preprocess_s'] += preprocess_time
+                entry['treino_s'] += fit_time
+                entry['predicao_s'] += score_time
+
+            if budget == len(folds):
+                break
+            ranked = sorted(alive, key=lambda n: -_mean(stats[n]))
+            keep = max(1, math.ceil(len(alive) / factor))
+            for name in ranked[keep:]:
+                stats[name]['eliminado_na_rodada'] = rung
+            alive = [name for name in alive if name in ranked[:keep]]
+            done, budget = budget, min(len(folds), budget * factor)
+            rung += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    table = []
+    for name in by_name:
+        entry = stats[name]
+        scores = [entry['scores'][f] for f in sorted(entry['scores'])]
+        table.append({'candidato': name, 'dobras': len(scores), 'media': np.mean(scores),
+                      'desvio': np.std(scores), 'preprocess_s': entry['preprocess_s'],
+                      'treino_s': entry['treino_s'], 'predicao_s': entry['predicao_s'],
+                      'eliminado_na_rodada': entry['eliminado_na_rodada']})
+    table.sort(key=lambda row: (-row['dobras'], -row['media']))
+    return table
+
+
+def print_table(table):
+    print(f"{'Candidato':<22} {'Dobras':>6} {'Média':>7} {'Desvio':>7} {'Pré-proc. (s)':>13} "
+          f"{'Treino (s)':>10} {'Predição (s)':>12} {'Eliminado':>9}")
+    for row in table:
+        eliminated = '-' if row['eliminado_na_rodada'] is None else f"rodada {row['eliminado_na_rodada']}"
+        print(f"{row['candidato']:<22} {row['dobras']:>6} {row['media']:>7.4f} {row['desvio']:>7.4f} "
+              f"{row['preprocess_s']:>13.4f} {row['treino_s']:>10.4f} {row['predicao_s']:>12.4f} {eliminated:>9}")
+
+
+def write_table(table, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(table)
@@ -0,0 +1,270 @@
+"""
+Servidor de predição (asyncio) para os modelos do heart.csv.
+
+Carrega uma única vez o artefato do SVM (svm.npz, preditor só com NumPy) ou
+do KNN (knn.npz) e atende HTTP/1.1 com keep-alive, em TCP ou socket Unix:
+    POST /predict   corpo JSON: [age, restingbp, cholesterol] ou lista de linhas
+                    resposta:   {"predicoes": [...]}
+    GET  /metrics   contadores, vazão e histogramas de latência e de lote
+
+Pedidos que chegam juntos são agrupados em micro-lotes: o primeiro abre uma
+janela de `window_ms`, e tudo o que chegar nela (até `max_batch` linhas)
+vira uma única chamada a predict, fora do laço de eventos. Como cada conexão
+tem no máximo um pedido pendente, a janela fecha antes se todas as conexões
+abertas já estão no lote: um cliente sozinho não espera a janela.
+
+Os artefatos são gerados pelos scripts de treino com --artefato (por exemplo,
+`python svm.py --artefato svm.npz` na pasta SVM).
+
+Uso (a partir da pasta comum):
+    python serve.py --svm ../SVM/svm.npz --porta 8765 --janela-ms 1
+    python serve.py --knn ../KNN/knn.npz --unix /tmp/heart.sock
+"""
+import asyncio
+import bisect
+import json
+import math
+import os
+import stat
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from heart_stream import FEATURES
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class Histogram:
+    """
+    Buckets log-espaçados (per_octave por potência de 2) entre lo e hi; os
+    percentis saem do limite superior do bucket, com erro relativo de no
+    máximo 2 ** (1 / per_octave) - 1.
+    """
+
+    def __init__(self, lo=1e-5, hi=10.0, per_octave=4):
+        n = math.ceil(math.log2(hi / lo) * per_octave) + 1
+        self.bounds = [lo * 2 ** (i / per_octave) for i in range(n)]
+        self.counts = [0] * (n + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, q):
+        if not self.count:
+            return 0.0
+        rank = math.ceil(q / 100 * self.count)
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return min(self.bounds[i], self.max) if i < len(self.bounds) else self.max
+        return self.max
+
+    def summary(self):
+        return {'n': self.count, 'media': self.total / self.count if self.count else 0.0,
+                'p50': self.percentile(50), 'p90': self.percentile(90), 'p99': self.percentile(99),
+                'max': self.max}
+
+    def buckets(self):
+        """[(limite superior, contagem)] dos buckets não vazios; limite None: acima de hi."""
+        return [(self.bounds[i] if i < len(self.bounds) else None, c)
+                for i, c in enumerate(self.counts) if c]
+
+
+def load_model(kind, path):
+    """'svm' -> SVMArtifact (só NumPy); 'knn' -> KNNArtifact (índice do sklearn)."""
+    folder = {'svm': 'SVM', 'knn': 'KNN'}[kind]
+    sys.path.append(str(ROOT / folder))
+    module = __import__(f"{kind}_artifact")
+    return module.load_artifact(path)
+
+
+class PredictionServer:
+
+    def __init__(self, model, window_ms=1.0, max_batch=256):
+        self.model = model
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.queue = None
+        # Um só thread: predict roda fora do laço de eventos, um lote por vez
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+        self.started = time.perf_counter()
+        self.requests = self.rows = self.batches = self.errors = 0
+        self.connections = 0
+        self.latency = Histogram()
+        self.predict_time = Histogram()
+        self.batch_rows = Histogram(lo=1, hi=1e5, per_octave=2)
+
+    # ===== Micro-lotes =====
+
+    async def _next_batch(self):
+        loop = asyncio.get_running_loop()
+        items = [await self.queue.get()]
+        n_rows = len(items[0][0])
+        deadline = loop.time() + self.window
+        while n_rows < self.max_batch:
+            if len(items) >= self.connections and self.queue.empty():
+                break
+            try:
+                item = self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            items.append(item)
+            n_rows += len(item[0])
+        return items, n_rows
+
+    async def _batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            items, n_rows = await self._next_batch()
+            X = np.vstack([rows for rows, _ in items])
+            start = time.perf_counter()
+            try:
+                y_pred = await loop.run_in_executor(self._executor, self.model.predict, X)
+            except Exception as exc:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            self.predict_time.add(time.perf_counter() - start)
+            self.batches += 1
+            self.batch_rows.add(n_rows)
+
+            offset = 0
+            for rows, future in items:
+                if not future.done():
+                    future.set_result(y_pred[offset:offset + len(rows)])
+                offset += len(rows)
+
+    async def predict(self, X):
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((X, future))
+        return await future
+
+    # ===== HTTP =====
+
+    def metrics(self):
+        uptime = time.perf_counter() - self.started
+        return {
+            'uptime_s': uptime, 'conexoes': self.connections, 'requisicoes': self.requests,
+            'linhas': self.rows, 'lotes': self.batches, 'erros': self.errors,
+            'requisicoes_por_s': self.requests / uptime, 'linhas_por_s': self.rows / uptime,
+            'latencia_s': self.latency.summary(), 'latencia_buckets': self.latency.buckets(),
+            'predicao_s': self.predict_time.summary(), 'linhas_por_lote': self.batch_rows.summary(),
+        }
+
+    async def _route(self, method, path, body):
+        if method == 'GET' and path == '/metrics':
+            return 200, self.metrics()
+        if method != 'POST' or path != '/predict':
+            return 404, {'erro': f"{method} {path} não existe"}
+        try:
+            X = np.asarray(json.loads(body), dtype=np.float64)
+        except (ValueError, TypeError):
+            return 400, {'erro': "corpo deve ser JSON numérico"}
+        if X.ndim == 1:
+            X = X[None, :]
+        if X.ndim != 2 or X.shape[1] != len(FEATURES) or not len(X):
+            return 400, {'erro': f"cada linha precisa de {len(FEATURES)} valores: {', '.join(FEATURES)}"}
+        y_pred = await self.predict(X)
+        self.requests += 1
+        self.rows += len(X)
+        return 200, {'predicoes': y_pred.tolist()}
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                start = time.perf_counter()
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                try:
+                    status, payload = await self._route(method, path, body)
+                except Exception as exc:
+                    status, payload = 500, {'erro': repr(exc)}
+                if status != 200:
+                    self.errors += 1
+                data = json.dumps(payload).encode()
+                writer.write(f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                             f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n"
+                             .encode('latin-1') + data)
+                await writer.drain()
+                if path == '/predict' and status == 200:
+                    self.latency.add(time.perf_counter() - start)
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError, ValueError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8765, unix=None):
+        self.queue = asyncio.Queue()
+        batcher = asyncio.create_task(self._batcher())
+        if unix:
+            # Socket de uma execução anterior (só se for mesmo um socket)
+            if os.path.exists(unix) and stat.S_ISSOCK(os.stat(unix).st_mode):
+                os.unlink(unix)
+            server = await asyncio.start_unix_server(self.handle, path=unix)
+            where = unix
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+            where = f"http://{host}:{port}"
+        print(f"Servindo em {where} (janela {self.window * 1000:g} ms, lote máximo {self.max_batch})", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+
+
+def arg(name, default):
+    return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+
+if __name__ == '__main__':
+    if '--svm' in sys.argv:
+        kind, path = 'svm', arg('--svm', None)
+    elif '--knn' in sys.argv:
+        kind, path = 'knn', arg('--knn', None)
+    else:
+        sys.exit("Informe o modelo: --svm ../SVM/svm.npz ou --knn ../KNN/knn.npz")
+
+    start = time.perf_counter()
+    model = load_model(kind, path)
+    print(f"Modelo {kind} carregado de {path} em {(time.perf_counter() - start) * 1000:.1f} ms", flush=True)
+
+    server = PredictionServer(model, window_ms=float(arg('--janela-ms', 1.0)), max_batch=int(arg('--lote-max', 256)))
+    try:
+        asyncio.run(server.serve(arg('--host', '127.0.0.1'), int(arg('--porta', 8765)), arg('--unix', None)))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,149 @@
+import os
+import random
+import time
+from collections import deque, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from maze import Maze, Pos
+from search import _id_array, _id_path
+
+Query = Tuple[Pos, Pos]
+SearchResult = Tuple[Optional[List[Pos]], Optional[float], int, int]
+
+# Grade compartilhada pelo processo trabalhador (ver _attach_grid)
+_GRID = None
+
+
+class _SharedGrid:
+    """
+    Visão somente-leitura do mapa de passabilidade de um Maze, anexada a um
+    bloco de memória compartilhada. Expõe apenas o que os kernels por id usam.
+    """
+
+    def __init__(self, shm_name: str, n: int, stride: int):
+        self._shm = shared_memory.SharedMemory(name=shm_name)
+        self.open = self._shm.buf[:n]
+        self.stride = stride
+        self.offsets = (-stride, stride, -1, 1)
+
+    def cell_pos(self, i: int) -> Pos:
+        return divmod(i, self.stride)
+
+
+def _attach_grid(shm_name: str, n: int, stride: int) -> None:
+    global _GRID
+    _GRID = _SharedGrid(shm_name, n, stride)
+
+
+def _bfs_tree(grid, source_id: int, goal_ids: Sequence[int]) -> Dict[int, SearchResult]:
+    """
+    Uma única BFS a partir de `source_id` que atende a todos os objetivos do
+    grupo. Para quando o último objetivo é retirado da fila. Como os passos
+    custam 1, a árvore de BFS é a mesma de Dijkstra. Cada objetivo recebe os
+    nós expandidos e o pico de memória acumulados até ser alcançado, que é o
+    que uma BFS isolada para aquele par reportaria.
+    """
+    open_ = grid.open
+    offsets = grid.offsets
+    n = len(open_)
+
+    remaining = set(goal_ids)
+    results: Dict[int, SearchResult] = {}
+
+    parent = _id_array(n, -1)
+    explored = bytearray(n)
+    explored[source_id] = 1
+    explored_count = 1
+
+    nodes_expanded = 0
+    frontier = deque([source_id])
+    max_memory_usage = len(frontier) + explored_count
+    while frontier and remaining:
+        i = frontier.popleft()
+        nodes_expanded += 1
+        if i in remaining:
+            remaining.discard(i)
+            path = _id_path(grid, parent, i)
+            results[i] = (path, float(len(path) - 1), nodes_expanded, max_memory_usage)
+        for off in offsets:
+            j = i + off
+            if 0 <= j < n and open_[j] and not explored[j]:
+                explored[j] = 1
+                explored_count += 1
+                parent[j] = i
+                frontier.append(j)
+        current_memory = len(frontier) + explored_count
+        if current_memory > max_memory_usage:
+            max_memory_usage = current_memory
+
+    for goal_id in remaining:
+        results[goal_id] = (None, None, nodes_expanded, max_memory_usage)
+    return results
+
+
+def _solve_group(source_id: int, goal_ids: List[int]) -> Tuple[int, Dict[int, SearchResult]]:
+    return source_id, _bfs_tree(_GRID, source_id, goal_ids)
+
+
+def solve_queries(maze: Maze, queries: Sequence[Query], workers: int = 1) -> List[SearchResult]:
+    """
+    Resolve vários pares (início, objetivo) sobre o mesmo labirinto.
+
+    Consultas com a mesma origem são agrupadas em uma única árvore de BFS.
+    Com workers > 1, os grupos são distribuídos em um ProcessPoolExecutor; o
+    mapa de passabilidade vai uma única vez para memória compartilhada e os
+    trabalhadores o anexam, em vez de receber o labirinto serializado a cada
+    tarefa.
+    Retorna, na ordem das consultas: (caminho, custo, nós_expandidos, pico_memoria)
+    """
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for start, goal in queries:
+        for p in (start, goal):
+            if not (maze.in_bounds(p) and maze.passable(p)):
+                raise ValueError(f"Posição {p} inválida ou bloqueada no labirinto")
+        groups[maze.cell_id(start)].append(maze.cell_id(goal))
+
+    trees: Dict[int, Dict[int, SearchResult]] = {}
+    if workers <= 1 or len(groups) <= 1:
+        for source_id, goal_ids in groups.items():
+            trees[source_id] = _bfs_tree(maze, source_id, goal_ids)
+    else:
+        open_ = maze.open
+        shm = shared_memory.SharedMemory(create=True, size=max(len(open_), 1))
+        try:
+            shm.buf[:len(open_)] = open_
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_grid,
+                                     initargs=(shm.name, len(open_), maze.stride)) as pool:
+                chunksize = max(1, len(groups) // (workers * 4))
+                for source_id, tree in pool.map(_solve_group, groups.keys(), groups.values(),
+                                                chunksize=chunksize):
+                    trees[source_id] = tree
+        finally:
+            shm.close()
+            shm.unlink()
+
+    return [trees[maze.cell_id(start)][maze.cell_id(goal)] for start, goal in queries]
+
+
+if __name__ == '__main__':
+    try:
+        maze_instance = Maze('../data/labirinto2.txt')
+
+        free_cells = [(r, c) for r in range(maze_instance.H) for c in range(maze_instance.W)
+                      if maze_instance.passable((r, c))]
+        rnd = random.Random(42)
+        sources = rnd.sample(free_cells, min(10, len(free_cells)))
+        queries = [(rnd.choice(sources), rnd.choice(free_cells)) for _ in range(1000)]
+        print(f"{len(queries)} consultas, {len(set(s for s, _ in queries))} origens distintas\n")
+
+        for workers in (1, max(2, os.cpu_count() or 1)):
+            start_time = time.perf_counter()
+            results = solve_queries(maze_instance, queries, workers=workers)
+            elapsed_time = time.perf_counter() - start_time
+            solved = sum(1 for path, *_ in results if path is not None)
+            print(f"Trabalhadores: {workers}  Tempo: {elapsed_time:.6f} segundos  Resolvidas: {solved}/{len(queries)}")
+
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Ocorreu um erro: {e}")
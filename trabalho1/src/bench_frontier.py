@@ -0,0 +1,60 @@
+"""
+Compara as fronteiras do A* (ver frontiers.py) no mesmo labirinto: heapq com
+entradas obsoletas, heap indexado com decrease-key e fila de baldes de Dial,
+com e sem o descarte de entradas obsoletas (stale_check).
+
+Uso:
+    python3 bench_frontier.py ../data/labirinto2.txt
+    python3 bench_frontier.py --gerar 1000      # gera um labirinto 1000x1000 temporário
+"""
+import os
+import sys
+import tempfile
+
+from bench_load import generate_maze
+from frontiers import FRONTIERS
+from heuristics import h_manhattan, h_euclidean
+from instrumentation import SearchStats, time_runs, profile_run
+from maze import Maze
+from search import a_star_search_ids, a_star_frontier_search
+
+REPEATS = 5
+WARMUP = 1
+
+
+def benchmark(path: str) -> None:
+    maze_instance = Maze(path)
+    print(f"Labirinto: {path} ({maze_instance.H}x{maze_instance.W})")
+    print(f"Início: {maze_instance.start}, Objetivo: {maze_instance.goal}\n")
+
+    for h_name, h_func in (("Manhattan", h_manhattan), ("Euclidean", h_euclidean)):
+        runs = [("A* (referência)", a_star_search_ids, (maze_instance, h_func))]
+        for frontier in FRONTIERS:
+            for stale_check in (True, False):
+                label = f"{frontier}{'' if stale_check else ' sem descarte'}"
+                runs.append((label, a_star_frontier_search, (maze_instance, h_func, frontier, stale_check)))
+
+        print(f"Heurística {h_name}:")
+        print(f"  {'Fronteira':<22} {'Custo':>8} {'Expandidos':>11} {'Memória':>9} "
+              f"{'Mediana (s)':>12} {'p95 (s)':>10} {'Pico (KB)':>10}")
+        for label, func, func_args in runs:
+            stats = SearchStats()
+            _, cost, expanded_nodes, memory_usage = time_runs(func, func_args, REPEATS, WARMUP, stats)
+            profile_run(func, func_args, stats)
+            cost_str = f"{cost:.0f}" if cost is not None else "-"
+            print(f"  {label:<22} {cost_str:>8} {expanded_nodes:>11} {memory_usage:>9} "
+                  f"{stats.median:>12.6f} {stats.p95:>10.6f} {stats.peak_bytes / 1024:>10.1f}")
+        print()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if len(args) == 2 and args[0] == "--gerar":
+        with tempfile.TemporaryDirectory() as tmp:
+            maze_filepath = os.path.join(tmp, "labirinto.txt")
+            generate_maze(int(args[1]), maze_filepath)
+            benchmark(maze_filepath)
+    elif len(args) == 1:
+        benchmark(args[0])
+    else:
+        print(__doc__)
@@ -0,0 +1,85 @@
+"""
+Compara o carregamento de labirintos: Maze (leitura completa) x MappedMaze (mmap).
+
+Cada carregador roda em um processo separado, para que o pico de memória
+residente (ru_maxrss) de um não contamine o do outro.
+
+Uso:
+    python3 bench_load.py ../data/labirinto2.txt
+    python3 bench_load.py --gerar 4000      # gera um labirinto 4000x4000 temporário
+"""
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+LOADERS = ("Maze", "MappedMaze")
+
+
+def generate_maze(size: int, path: str, wall_ratio: float = 0.3, seed: int = 0) -> None:
+    rnd = random.Random(seed)
+    with open(path, 'w') as f:
+        for r in range(size):
+            row = ['#' if rnd.random() < wall_ratio else '.' for _ in range(size)]
+            if r == 0:
+                row[0] = 'S'
+            if r == size - 1:
+                row[-1] = 'G'
+            f.write(''.join(row) + '\n')
+
+
+def run_worker(loader: str, path: str) -> None:
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if loader == "Maze":
+        from maze import Maze as cls
+    else:
+        from maze_mmap import MappedMaze as cls
+
+    start_time = time.perf_counter()
+    mz = cls(path)
+    elapsed_time = time.perf_counter() - start_time
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        "loader": loader, "time": elapsed_time,
+        "peak_kb": peak_kb, "delta_kb": peak_kb - baseline_kb,
+        "H": mz.H, "W": mz.W, "start": mz.start, "goal": mz.goal,
+    }))
+
+
+def benchmark(path: str) -> None:
+    path = os.path.abspath(path)
+    size_mb = os.path.getsize(path) / 2 ** 20
+    print(f"Arquivo: {path} ({size_mb:.1f} MB)\n")
+    here = os.path.dirname(os.path.abspath(__file__))
+
+    for loader in LOADERS:
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker", loader, path],
+            cwd=here, capture_output=True, text=True, check=True
+        ).stdout
+        data = json.loads(out)
+        print(f"{loader}:")
+        print(f"  Dimensões:          {data['H']}x{data['W']}  S={data['start']}  G={data['goal']}")
+        print(f"  Tempo de carga:     {data['time']:.4f} segundos")
+        print(f"  Pico de RSS:        {data['peak_kb'] / 1024:.1f} MB")
+        print(f"  Acréscimo de RSS:   {data['delta_kb'] / 1024:.1f} MB\n")
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if len(args) == 3 and args[0] == "--worker":
+        run_worker(args[1], args[2])
+    elif len(args) == 2 and args[0] == "--gerar":
+        with tempfile.TemporaryDirectory() as tmp:
+            maze_filepath = os.path.join(tmp, "labirinto.txt")
+            generate_maze(int(args[1]), maze_filepath)
+            benchmark(maze_filepath)
+    elif len(args) == 1:
+        benchmark(args[0])
+    else:
+        print(__doc__)
@@ -0,0 +1,261 @@
+import heapq
+import itertools
+from typing import Callable, Dict, List, Optional, Tuple
+
+from maze import Maze, Pos
+
+INF = float('inf')
+
+
+def ida_star_search(maze: Maze, heuristic: Callable[[Pos, Pos], float],
+                    cache_size: int = 100_000) -> Tuple[Optional[List[Pos]], Optional[float], int, int]:
+    """
+    IDA*: busca em profundidade limitada por f = g + h, com o limite subindo
+    para o menor f que o excedeu na iteração anterior. A memória fica restrita
+    à pilha do caminho atual mais uma tabela de transposição (id -> menor g
+    visto na iteração) com no máximo `cache_size` entradas; quando cheia,
+    descarta as entradas mais antigas. A tabela evita reexpandir, dentro de
+    uma iteração, células já alcançadas com g menor ou igual.
+    Retorna: (caminho, custo, nós_expandidos, pico_memoria)
+    """
+    open_ = maze.open
+    offsets = maze.offsets
+    stride = maze.stride
+    n = len(open_)
+    start_id = maze.start_id
+    goal_id = maze.goal_id
+    goal_node = maze.goal
+
+    nodes_expanded = 0
+    max_memory_usage = 1
+
+    if start_id == goal_id:
+        return [maze.start], 0.0, 1, max_memory_usage
+
+    on_path = bytearray(n)
+    threshold = heuristic(maze.start, goal_node)
+
+    while True:
+        table: Dict[int, int] = {start_id: 0}
+        next_threshold = INF
+
+        # Cada quadro: [id, g, índice do próximo deslocamento a tentar]
+        stack = [[start_id, 0, 0]]
+        on_path[start_id] = 1
+        nodes_expanded += 1
+
+        while stack:
+            frame = stack[-1]
+            i, g, k = frame
+            if k == len(offsets):
+                stack.pop()
+                on_path[i] = 0
+                continue
+            frame[2] = k + 1
+
+            j = i + offsets[k]
+            if not (0 <= j < n and open_[j]) or on_path[j]:
+                continue
+            new_cost = g + 1
+
+            if j == goal_id:
+                path = [maze.cell_pos(f[0]) for f in stack] + [maze.goal]
+                for f in stack:
+                    on_path[f[0]] = 0
+                return path, float(new_cost), nodes_expanded, max_memory_usage
+
+            f_value = new_cost + heuristic(divmod(j, stride), goal_node)
+            if f_value > threshold:
+                if f_value < next_threshold:
+                    next_threshold = f_value
+                continue
+
+            seen_g = table.get(j)
+            if seen_g is not None and seen_g <= new_cost:
+                continue
+            if seen_g is None and len(table) >= cache_size:
+                del table[next(iter(table))]
+            table[j] = new_cost
+
+            stack.append([j, new_cost, 0])
+            on_path[j] = 1
+            nodes_expanded += 1
+
+            current_memory = len(stack) + len(table)
+            if current_memory > max_memory_usage:
+                max_memory_usage = current_memory
+
+        if next_threshold == INF:
+            return None, None, nodes_expanded, max_memory_usage
+        threshold = next_threshold
+
+
+class _Node:
+    __slots__ = ('cell', 'g', 'f', 'depth', 'parent', 'children', 'forgotten', 'expanded', 'alive', 'version')
+
+    def __init__(self, cell: int, g: int, f: float, depth: int, parent: Optional['_Node']):
+        self.cell = cell
+        self.g = g
+        self.f = f
+        self.depth = depth
+        self.parent = parent
+        self.children: List['_Node'] = []
+        # Filhos esquecidos: célula -> último f conhecido (backup)
+        self.forgotten: Dict[int, float] = {}
+        self.expanded = False
+        self.alive = True
+        self.version = 0
+
+
+def _sma_path(maze: Maze, node: _Node) -> List[Pos]:
+    path = []
+    while node is not None:
+        path.append(maze.cell_pos(node.cell))
+        node = node.parent
+    path.reverse()
+    return path
+
+
+def sma_star_search(maze: Maze, heuristic: Callable[[Pos, Pos], float],
+                    max_nodes: int = 50_000,
+                    heap=heapq) -> Tuple[Optional[List[Pos]], Optional[float], int, int]:
+    """
+    SMA* (Simplified Memory-bounded A*): A* que mantém no máximo `max_nodes`
+    nós na árvore de busca. Quando a memória enche, esquece a folha de maior f
+    (a mais rasa, no empate) e guarda esse f no pai, que volta para a
+    fronteira e regenera o filho, com o f lembrado, se ele voltar a ser o
+    melhor. Um sucessor não é gerado se a mesma célula já está em memória com
+    g menor ou igual. Encontra o caminho ótimo se ele couber no orçamento
+    (profundidade < max_nodes); caso contrário, não devolve caminho.
+    `heap`: ver search.a_star_search_ids.
+    Retorna: (caminho, custo, nós_expandidos, pico_memoria)
+    """
+    open_ = maze.open
+    offsets = maze.offsets
+    stride = maze.stride
+    n = len(open_)
+    goal_id = maze.goal_id
+    goal_node = maze.goal
+
+    def h(cell: int) -> float:
+        return heuristic(divmod(cell, stride), goal_node)
+
+    counter = itertools.count()
+    # Heaps preguiçosos: entradas com versão antiga ou nó morto são ignoradas
+    best_heap: List[tuple] = []
+    leaf_heap: List[tuple] = []
+
+    root = _Node(maze.start_id, 0, h(maze.start_id), 0, None)
+    in_memory: Dict[int, _Node] = {root.cell: root}
+    node_count = 1
+
+    def open_key(node: _Node) -> float:
+        # Nó ainda não expandido: seu próprio f. Nó com filhos esquecidos: o
+        # melhor f entre eles, que é o que uma reexpansão regeneraria.
+        if not node.expanded:
+            return node.f
+        return min(node.forgotten.values()) if node.forgotten else INF
+
+    def touch(node: _Node) -> None:
+        node.version += 1
+        key = open_key(node)
+        if key < INF:
+            heap.heappush(best_heap, (key, -node.depth, next(counter), node.version, node))
+        if not node.children and node is not root:
+            heap.heappush(leaf_heap, (-node.f, node.depth, next(counter), node.version, node))
+
+    def backup(node: Optional[_Node]) -> None:
+        while node is not None and node.expanded:
+            new_f = min([c.f for c in node.children] + list(node.forgotten.values()) + [INF])
+            if new_f == node.f:
+                touch(node)
+                return
+            node.f = new_f
+            touch(node)
+            node = node.parent
+
+    def prune_worst_leaf() -> bool:
+        nonlocal node_count
+        while leaf_heap:
+            _, _, _, version, leaf = heap.heappop(leaf_heap)
+            if not leaf.alive or leaf.version != version or leaf.children:
+                if heap is not heapq:
+                    heap.stale_pops += 1
+                continue
+            parent = leaf.parent
+            parent.children.remove(leaf)
+            parent.forgotten[leaf.cell] = leaf.f
+            leaf.alive = False
+            node_count -= 1
+            if in_memory.get(leaf.cell) is leaf:
+                del in_memory[leaf.cell]
+            touch(parent)
+            return True
+        return False
+
+    def compact_heaps() -> None:
+        best_heap[:] = [e for e in best_heap if e[4].alive and e[4].version == e[3]]
+        leaf_heap[:] = [e for e in leaf_heap if e[4].alive and e[4].version == e[3] and not e[4].children]
+        heap.heapify(best_heap)
+        heap.heapify(leaf_heap)
+
+    touch(root)
+    nodes_expanded = 0
+    max_memory_usage = node_count + len(best_heap)
+
+    while best_heap:
+        key, _, _, version, node = heap.heappop(best_heap)
+        if not node.alive or node.version != version:
+            if heap is not heapq:
+                heap.stale_pops += 1
+            continue
+
+        if node.cell == goal_id:
+            return _sma_path(maze, node), float(node.g), nodes_expanded, max_memory_usage
+
+        nodes_expanded += 1
+        new_cost = node.g + 1
+        if not node.expanded:
+            node.expanded = True
+            candidates = []
+            # Na profundidade máxima não cabe mais nenhum nó neste ramo; sem
+            # filhos, o backup abaixo marca o nó com f infinito
+            if node.depth < max_nodes - 1:
+                parent_cell = node.parent.cell if node.parent is not None else -1
+                for off in offsets:
+                    j = node.cell + off
+                    if 0 <= j < n and open_[j] and j != parent_cell:
+                        candidates.append((j, max(node.f, new_cost + h(j))))
+        else:
+            candidates = [(j, f) for j, f in node.forgotten.items() if f == key]
+            for j, _ in candidates:
+                del node.forgotten[j]
+
+        for j, f in candidates:
+            existing = in_memory.get(j)
+            if existing is not None and existing.g <= new_cost:
+                continue
+            child = _Node(j, new_cost, f, node.depth + 1, node)
+            node.children.append(child)
+            # Um nó pior para a mesma célula continua na árvore, mas com f
+            # maior: acaba esquecido como folha em vez de ser reexpandido
+            in_memory[j] = child
+            node_count += 1
+            touch(child)
+            # `node` tinha a menor chave da fronteira; um objetivo com o mesmo
+            # f já é ótimo e não pode ser esquecido por falta de memória
+            if j == goal_id and f == key:
+                return _sma_path(maze, child), float(new_cost), nodes_expanded, max(max_memory_usage, node_count)
+
+        backup(node)
+
+        while node_count > max_nodes and prune_worst_leaf():
+            pass
+        if len(best_heap) + len(leaf_heap) > 4 * max_nodes:
+            compact_heaps()
+
+        current_memory = node_count + len(best_heap)
+        if current_memory > max_memory_usage:
+            max_memory_usage = current_memory
+
+    return None, None, nodes_expanded, max_memory_usage
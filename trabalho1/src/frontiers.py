@@ -0,0 +1,154 @@
+"""
+Fronteiras para o A* sobre ids inteiros (ver a_star_frontier_search).
+
+Todas têm a mesma interface: push(id, f, g) insere ou melhora uma entrada,
+pop() devolve (id, g) da menor prioridade e len() dá o número de entradas
+guardadas. Os dois heaps desempatam f igual pelo maior g e depois pelo menor
+id: em grades, o nó mais profundo entre os de mesmo f tende a chegar antes
+ao objetivo. Os baldes usam o f truncado para inteiro e, dentro de um balde,
+devolvem a entrada inserida por último, que em geral (mas nem sempre) é a de
+maior g; assim, a ordem de expansão e o número de nós expandidos podem
+diferir entre as fronteiras.
+"""
+import heapq
+from array import array
+from typing import List, Tuple
+
+
+class BinaryHeapFrontier:
+    """
+    heapq com entradas (f, -g, id). Uma melhoria de g insere uma nova entrada
+    e a antiga fica obsoleta no heap, para ser descartada quando sair.
+    """
+
+    def __init__(self, n: int):
+        self._heap: List[Tuple[float, int, int]] = []
+
+    def push(self, i: int, f: float, g: int) -> None:
+        heapq.heappush(self._heap, (f, -g, i))
+
+    def pop(self) -> Tuple[int, int]:
+        _, neg_g, i = heapq.heappop(self._heap)
+        return i, -neg_g
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class IndexedHeapFrontier:
+    """
+    Heap binário indexado por id de célula, com decrease-key: cada célula
+    aparece no máximo uma vez, então não há entradas obsoletas e o heap nunca
+    passa do número de células abertas.
+    """
+
+    def __init__(self, n: int):
+        self._heap: List[int] = []
+        self._pos = array('i', [-1]) * n if n < 2 ** 31 else array('q', [-1]) * n
+        self._f = array('d', [0.0]) * n
+        self._g = array('i', [0]) * n if n < 2 ** 31 else array('q', [0]) * n
+
+    def _less(self, a: int, b: int) -> bool:
+        fa, fb = self._f[a], self._f[b]
+        return fa < fb or (fa == fb and (self._g[a] > self._g[b] or (self._g[a] == self._g[b] and a < b)))
+
+    def _sift_up(self, k: int) -> None:
+        heap, pos = self._heap, self._pos
+        i = heap[k]
+        while k > 0:
+            parent = (k - 1) >> 1
+            p = heap[parent]
+            if not self._less(i, p):
+                break
+            heap[k] = p
+            pos[p] = k
+            k = parent
+        heap[k] = i
+        pos[i] = k
+
+    def _sift_down(self, k: int) -> None:
+        heap, pos = self._heap, self._pos
+        size = len(heap)
+        i = heap[k]
+        while True:
+            child = 2 * k + 1
+            if child >= size:
+                break
+            if child + 1 < size and self._less(heap[child + 1], heap[child]):
+                child += 1
+            c = heap[child]
+            if not self._less(c, i):
+                break
+            heap[k] = c
+            pos[c] = k
+            k = child
+        heap[k] = i
+        pos[i] = k
+
+    def push(self, i: int, f: float, g: int) -> None:
+        self._f[i] = f
+        self._g[i] = g
+        k = self._pos[i]
+        if k < 0:
+            self._heap.append(i)
+            self._sift_up(len(self._heap) - 1)
+        else:
+            # Só melhorias chegam aqui (g menor, h igual), então f só diminui
+            self._sift_up(k)
+
+    def pop(self) -> Tuple[int, int]:
+        heap = self._heap
+        top = heap[0]
+        last = heap.pop()
+        self._pos[top] = -1
+        if heap:
+            heap[0] = last
+            self._pos[last] = 0
+            self._sift_down(0)
+        return top, self._g[top]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class BucketFrontier:
+    """
+    Fila de baldes (algoritmo de Dial) para prioridades inteiras: o balde f
+    guarda as entradas (id, g) com essa prioridade. Como f nunca diminui
+    abaixo do balde atual com heurística consistente, basta um cursor que só
+    avança. Dentro de um balde a ordem é LIFO, que favorece as entradas mais
+    recentes, em geral as de maior g. Prioridades fracionárias são truncadas
+    (floor de uma heurística consistente continua consistente).
+    """
+
+    def __init__(self, n: int):
+        self._buckets: List[List[Tuple[int, int]]] = []
+        self._cursor = 0
+        self._size = 0
+
+    def push(self, i: int, f: float, g: int) -> None:
+        f = int(f)
+        buckets = self._buckets
+        while len(buckets) <= f:
+            buckets.append([])
+        buckets[f].append((i, g))
+        if f < self._cursor:
+            self._cursor = f
+        self._size += 1
+
+    def pop(self) -> Tuple[int, int]:
+        buckets = self._buckets
+        while not buckets[self._cursor]:
+            self._cursor += 1
+        self._size -= 1
+        return buckets[self._cursor].pop()
+
+    def __len__(self) -> int:
+        return self._size
+
+
+FRONTIERS = {
+    'heap': BinaryHeapFrontier,
+    'indexed': IndexedHeapFrontier,
+    'buckets': BucketFrontier,
+}
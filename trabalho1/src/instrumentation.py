@@ -0,0 +1,173 @@
+"""
+Instrumentação opcional dos algoritmos de busca.
+
+Nada aqui é chamado pelos algoritmos: as medições acontecem em execuções
+separadas, que passam às buscas com heap um HeapCounter no parâmetro `heap`
+(o padrão é o próprio módulo `heapq`) ou ligam o tracemalloc. Com a
+instrumentação desligada, as buscas rodam exatamente como estão.
+"""
+import csv
+import heapq
+import inspect
+import json
+import math
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+
+class SearchStats:
+    """Contadores e tempos coletados para um algoritmo."""
+
+    def __init__(self):
+        self.times: List[float] = []
+        # Tempos por etapa: carga e landmarks no driver; fases da busca em profile_run
+        self.timings: Dict[str, float] = {}
+        self.heap_pushes: Optional[int] = None
+        self.heap_pops: Optional[int] = None
+        self.stale_pops: Optional[int] = None
+        self.peak_bytes: Optional[int] = None
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start_time
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def p95(self) -> float:
+        # Percentil pelo método do posto mais próximo
+        ordered = sorted(self.times)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": len(self.times),
+            "median_s": self.median,
+            "p95_s": self.p95,
+            "min_s": min(self.times),
+            "max_s": max(self.times),
+            "heap_pushes": self.heap_pushes,
+            "heap_pops": self.heap_pops,
+            "stale_pops": self.stale_pops,
+            "peak_bytes": self.peak_bytes,
+            **{f"time_{name}_s": value for name, value in self.timings.items()},
+        }
+
+
+class HeapCounter:
+    """
+    Operações de `heapq` que contam e cronometram inserções e remoções,
+    passadas às buscas pelo parâmetro `heap`. As remoções obsoletas (entradas
+    que a busca descarta ao sair do heap) são contadas pela própria busca em
+    `stale_pops`, já que só ela sabe quando uma entrada está obsoleta.
+    `last_op` guarda o instante da última operação: o que vem depois dela é
+    a reconstrução do caminho.
+    """
+
+    def __init__(self):
+        self.pushes = self.pops = self.stale_pops = 0
+        self.heap_s = 0.0
+        self.last_op: Optional[float] = None
+
+    def heappush(self, heap: list, item: Any) -> None:
+        start_time = time.perf_counter()
+        heapq.heappush(heap, item)
+        self.last_op = time.perf_counter()
+        self.heap_s += self.last_op - start_time
+        self.pushes += 1
+
+    def heappop(self, heap: list) -> Any:
+        start_time = time.perf_counter()
+        item = heapq.heappop(heap)
+        self.last_op = time.perf_counter()
+        self.heap_s += self.last_op - start_time
+        self.pops += 1
+        return item
+
+    def heapify(self, heap: list) -> None:
+        start_time = time.perf_counter()
+        heapq.heapify(heap)
+        self.last_op = time.perf_counter()
+        self.heap_s += self.last_op - start_time
+
+
+def time_runs(func: Callable, args: Sequence, repeats: int = 5, warmup: int = 1,
+              stats: Optional[SearchStats] = None):
+    """
+    Executa `func(*args)` `warmup` vezes sem medir e `repeats` vezes medindo.
+    Retorna o resultado da última execução; os tempos vão para `stats.times`.
+    """
+    result = None
+    for _ in range(warmup):
+        result = func(*args)
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        result = func(*args)
+        elapsed_time = time.perf_counter() - start_time
+        if stats is not None:
+            stats.times.append(elapsed_time)
+    return result
+
+
+def profile_run(func: Callable, args: Sequence, stats: SearchStats) -> None:
+    """
+    Duas execuções extras: uma com HeapCounter (se a função aceita o
+    parâmetro `heap`) e outra com tracemalloc, para o pico real de bytes
+    alocados. A primeira separa o tempo da busca em fases: operações de heap,
+    reconstrução do caminho (depois da última operação de heap) e expansão
+    (o resto: vizinhos, heurística, testes). Os cronômetros em volta de cada
+    operação de heap entram na fase de heap, então a execução é mais lenta
+    que as medidas por time_runs.
+    """
+    if 'heap' in inspect.signature(func).parameters:
+        counter = HeapCounter()
+        start_time = time.perf_counter()
+        func(*args, heap=counter)
+        end_time = time.perf_counter()
+        stats.heap_pushes, stats.heap_pops, stats.stale_pops = counter.pushes, counter.pops, counter.stale_pops
+        path_s = end_time - counter.last_op if counter.last_op is not None else 0.0
+        stats.timings['fase_heap'] = counter.heap_s
+        stats.timings['fase_caminho'] = path_s
+        stats.timings['fase_expansao'] = end_time - start_time - counter.heap_s - path_s
+
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    with stats.timer('tracemalloc'):
+        func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    if not already_tracing:
+        tracemalloc.stop()
+    stats.peak_bytes = peak - baseline
+
+
+def write_reports(base_filepath: str, rows: Dict[str, SearchStats], extra: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Grava `<base>.json` e `<base>.csv`, uma linha por algoritmo, combinando as
+    estatísticas de tempo/instrumentação com os campos de `extra`.
+    """
+    table = []
+    for name in sorted(rows):
+        table.append({"algorithm": name, **extra.get(name, {}), **rows[name].as_dict()})
+
+    with open(base_filepath + '.json', 'w', encoding='utf-8') as f:
+        json.dump(table, f, ensure_ascii=False, indent=2)
+
+    fieldnames: List[str] = []
+    for row in table:
+        fieldnames.extend(k for k in row if k not in fieldnames)
+    with open(base_filepath + '.csv', 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(table)
@@ -0,0 +1,176 @@
+import os
+import struct
+from array import array
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from maze import Maze, Pos
+
+# Cabeçalho do arquivo de tabelas: assinatura, typecode, stride, n, k
+_MAGIC = b'ALT1'
+_HEADER = struct.Struct('<4scxxxqqq')
+
+# Maior valor de cada typecode, usado como marca de "inalcançável"
+_UNREACHABLE = {'H': 0xFFFF, 'I': 0xFFFFFFFF}
+
+
+def bfs_distances(maze: Maze, source_id: int) -> array:
+    """
+    Distância em passos de `source_id` até todas as células (-1 se inalcançável).
+    """
+    open_ = maze.open
+    offsets = maze.offsets
+    n = len(open_)
+
+    dist = array('i', [-1]) * n
+    dist[source_id] = 0
+    frontier = deque([source_id])
+    while frontier:
+        i = frontier.popleft()
+        d = dist[i] + 1
+        for off in offsets:
+            j = i + off
+            if 0 <= j < n and open_[j] and dist[j] < 0:
+                dist[j] = d
+                frontier.append(j)
+    return dist
+
+
+class Landmarks:
+    """
+    Heurística ALT (A*, Landmarks, desigualdade Triangular).
+
+    Para cada landmark L guarda d(L, x) para toda célula x. Como o grafo é não
+    direcionado, |d(L, a) - d(L, b)| <= d(a, b) para qualquer L, então o
+    máximo sobre os landmarks (e sobre Manhattan) é admissível e consistente.
+    As tabelas usam o menor typecode sem sinal que comporta as distâncias.
+    """
+
+    def __init__(self, maze: Maze, landmark_ids: List[int], tables: List[array]):
+        self.maze = maze
+        self.landmark_ids = landmark_ids
+        self.tables = tables
+        self.unreachable = _UNREACHABLE[tables[0].typecode] if tables else 0
+        self._goal: Optional[Pos] = None
+        self._goal_dists: List[int] = []
+
+    @classmethod
+    def build(cls, maze: Maze, k: int = 8) -> 'Landmarks':
+        """
+        Escolhe k landmarks por "ponto mais distante": cada novo landmark é a
+        célula alcançável mais longe dos já escolhidos, partindo do início.
+        """
+        k = max(1, k)
+        from_start = bfs_distances(maze, maze.start_id)
+        first = max(range(len(from_start)), key=from_start.__getitem__)
+
+        landmark_ids = [first]
+        dists = [bfs_distances(maze, first)]
+        nearest = array('i', dists[0])
+        while len(landmark_ids) < k:
+            far = max(range(len(nearest)), key=nearest.__getitem__)
+            if nearest[far] <= 0:
+                break
+            landmark_ids.append(far)
+            d = bfs_distances(maze, far)
+            dists.append(d)
+            for i, v in enumerate(d):
+                if v < nearest[i]:
+                    nearest[i] = v
+
+        max_dist = max(max(d) for d in dists)
+        typecode = 'H' if max_dist < _UNREACHABLE['H'] else 'I'
+        unreachable = _UNREACHABLE[typecode]
+        tables = [array(typecode, (unreachable if v < 0 else v for v in d)) for d in dists]
+        return cls(maze, landmark_ids, tables)
+
+    def save(self, filename: str) -> None:
+        typecode = self.tables[0].typecode
+        with open(filename, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, typecode.encode(), self.maze.stride,
+                                 len(self.maze.open), len(self.tables)))
+            array('q', self.landmark_ids).tofile(f)
+            for table in self.tables:
+                table.tofile(f)
+
+    @classmethod
+    def load(cls, maze: Maze, filename: str) -> 'Landmarks':
+        with open(filename, 'rb') as f:
+            magic, typecode, stride, n, k = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC or stride != maze.stride or n != len(maze.open):
+                raise ValueError(f"Tabela de landmarks '{filename}' não corresponde ao labirinto")
+            landmark_ids = array('q')
+            landmark_ids.fromfile(f, k)
+            tables = []
+            for _ in range(k):
+                table = array(typecode.decode())
+                table.fromfile(f, n)
+                tables.append(table)
+        return cls(maze, list(landmark_ids), tables)
+
+    @classmethod
+    def for_maze(cls, maze: Maze, maze_filename: str, k: int = 8) -> 'Landmarks':
+        """
+        Carrega as tabelas de `<labirinto>.alt` se existirem e forem mais novas
+        que o labirinto; caso contrário, constrói e salva ao lado do arquivo.
+        """
+        alt_filename = maze_filename + '.alt'
+        if (os.path.exists(alt_filename)
+                and os.path.getmtime(alt_filename) >= os.path.getmtime(maze_filename)):
+            try:
+                landmarks = cls.load(maze, alt_filename)
+                if len(landmarks.tables) >= k:
+                    return landmarks
+            except (ValueError, EOFError, struct.error):
+                pass
+        landmarks = cls.build(maze, k)
+        landmarks.save(alt_filename)
+        return landmarks
+
+    def h_landmark(self, a: Pos, b: Pos) -> float:
+        stride = self.maze.stride
+        if b != self._goal:
+            j = b[0] * stride + b[1]
+            self._goal = b
+            self._goal_dists = [table[j] for table in self.tables]
+
+        i = a[0] * stride + a[1]
+        unreachable = self.unreachable
+        best = abs(a[0] - b[0]) + abs(a[1] - b[1])
+        for table, db in zip(self.tables, self._goal_dists):
+            da = table[i]
+            if da != unreachable and db != unreachable:
+                diff = da - db if da > db else db - da
+                if diff > best:
+                    best = diff
+        return float(best)
+
+
+class CachedHeuristic:
+    """
+    Memoriza h(x, objetivo) por id de célula, com uma tabela por objetivo
+    (o A* bidirecional alterna entre dois). Útil com heurísticas caras (como
+    h_landmark) em buscas que reavaliam células. As tabelas guardam inteiros
+    de 32 bits (-1 = ainda não calculado), então a heurística deve devolver
+    valores inteiros, como h_landmark e h_manhattan.
+    """
+
+    def __init__(self, maze: Maze, heuristic: Callable[[Pos, Pos], float]):
+        self.heuristic = heuristic
+        self.stride = maze.stride
+        self.n = len(maze.open)
+        self.tables: Dict[Pos, array] = {}
+        self.goal: Optional[Pos] = None
+        self.table = array('i')
+
+    def __call__(self, a: Pos, b: Pos) -> float:
+        if b != self.goal:
+            table = self.tables.get(b)
+            if table is None:
+                table = self.tables[b] = array('i', [-1]) * self.n
+            self.goal, self.table = b, table
+        i = a[0] * self.stride + a[1]
+        v = self.table[i]
+        if v < 0:
+            v = self.table[i] = int(self.heuristic(a, b))
+        return float(v)
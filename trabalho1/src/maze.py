@@ -1,32 +1,74 @@
-
-
 from typing import List, Tuple
- 
-Grid = List[List[str]]
+
 Pos = Tuple[int, int]
 
+# Ordem das ações (N, S, O, L) e deslocamentos em linhas/colunas
+ACTIONS = ('N', 'S', 'O', 'L')
+DELTAS = {'N': (-1, 0), 'S': (1, 0), 'O': (0, -1), 'L': (0, 1)}
+
+WALL = ord('#')
+ROW_END = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+
+# Tabela de tradução byte -> 0/1: tudo é passável, exceto parede e fim de linha
+_OPEN_TABLE = bytes(0 if b in (WALL, ROW_END, CARRIAGE_RETURN) else 1 for b in range(256))
+
+
 class Maze:
-     
+    """
+    Labirinto armazenado em um único buffer de bytes.
+
+    A linha r ocupa as posições [r*stride, r*stride + W) de `cells`, seguida de
+    um byte '\\n' que funciona como parede de borda (stride = W + 1). Assim, o
+    identificador inteiro de uma célula é r*stride + c, e os vizinhos de uma
+    célula i são i + off para cada off em `offsets`, sem que um passo para
+    O/L "dê a volta" para a linha vizinha. `open` é o mapa de passabilidade
+    pré-calculado (1 = livre, 0 = parede/borda).
+    """
+
     def __init__(self, filename: str):
-       
+
         try:
-            with open(filename, 'r') as f:
-                self.grid = [list(line.strip()) for line in f.readlines()]
+            with open(filename, 'rb') as f:
+                rows = [line.strip() for line in f.readlines()]
         except FileNotFoundError:
             raise FileNotFoundError(f"Erro: O arquivo '{filename}' não foi encontrado.")
-        
-        self.H = len(self.grid) 
-        self.W = len(self.grid[0]) if self.H > 0 else 0 
-        
+
+        self.H = len(rows)
+        self.W = max(map(len, rows)) if self.H > 0 else 0
+        self._build(b''.join(row.ljust(self.W, b'#') + b'\n' for row in rows))
+
         self.start = self._find('S')
         self.goal = self._find('G')
 
+    def _build(self, cells) -> None:
+        self.stride = self.W + 1
+        self.cells = cells
+        self.open = cells.translate(_OPEN_TABLE)
+        # Deslocamentos de id para cada ação, na mesma ordem de ACTIONS
+        self.offsets = (-self.stride, self.stride, -1, 1)
+        self.moves = tuple(zip(ACTIONS, self.offsets))
+
     def _find(self, char: str) -> Pos:
-        for r in range(self.H):
-            for c in range(self.W):
-                if self.grid[r][c] == char:
-                    return (r, c)
-        raise ValueError(f"Caractere '{char}' não encontrado no grid")
+        i = self.cells.find(char.encode())
+        if i < 0:
+            raise ValueError(f"Caractere '{char}' não encontrado no grid")
+        return self.cell_pos(i)
+
+    def cell_id(self, p: Pos) -> int:
+        r, c = p
+        return r * self.stride + c
+
+    def cell_pos(self, i: int) -> Pos:
+        return divmod(i, self.stride)
+
+    @property
+    def start_id(self) -> int:
+        return self.cell_id(self.start)
+
+    @property
+    def goal_id(self) -> int:
+        return self.cell_id(self.goal)
 
     def in_bounds(self, p: Pos) -> bool:
         r, c = p
@@ -34,30 +76,25 @@ class Maze:
 
     def passable(self, p: Pos) -> bool:
         r, c = p
-        return self.grid[r][c] != '#'
+        return self.open[r * self.stride + c] == 1
 
     def actions(self, p: Pos) -> List[str]:
         acts = []
-        r, c = p
-        candidates = {
-            'N': (r - 1, c),
-            'S': (r + 1, c),
-            'O': (r, c - 1),
-            'L': (r, c + 1)
-        }
-        
-        for action, (nr, nc) in candidates.items():
-            q = (nr, nc)
-            if self.in_bounds(q) and self.passable(q):
+        i = self.cell_id(p)
+        n = len(self.open)
+        open_ = self.open
+
+        for action, off in self.moves:
+            j = i + off
+            if 0 <= j < n and open_[j]:
                 acts.append(action)
         return acts
 
     def result(self, p: Pos, a: str) -> Pos:
         r, c = p
-        delta = {'N': (-1, 0), 'S': (1, 0), 'O': (0, -1), 'L': (0, 1)}
-        dr, dc = delta[a]
+        dr, dc = DELTAS[a]
         q = (r + dr, c + dc)
-        
+
         if not (self.in_bounds(q) and self.passable(q)):
             raise ValueError(f"Ação '{a}' inválida na posição {p}")
         return q
@@ -0,0 +1,92 @@
+import mmap
+from functools import cached_property
+from typing import List
+
+from maze import Maze, Pos, ACTIONS, CARRIAGE_RETURN, _OPEN_TABLE
+
+# Tamanho dos blocos usados ao materializar o mapa de passabilidade
+_CHUNK = 1 << 24
+
+
+class MappedMaze(Maze):
+    """
+    Labirinto lido via mmap, sem copiar o arquivo para a memória.
+
+    O arquivo já tem o mesmo layout do buffer de `Maze`: cada linha tem W
+    células seguidas do fim de linha ('\\n' ou '\\r\\n'), que serve de parede de
+    borda. Por isso `cells` é o próprio buffer mapeado e o id de (r, c) é
+    r*stride + c. As linhas devem ter todas a mesma largura.
+
+    `passable` e `actions` leem direto do buffer, sem cópia. Já os kernels
+    por id de `search.py` testam `open[j]`, que precisa valer 0 em parede e
+    fim de linha: no primeiro acesso, `open` é materializado em um bytearray
+    do tamanho do arquivo (uma cópia, feita uma vez e reaproveitada pelas
+    buscas seguintes até `close`).
+    """
+
+    def __init__(self, filename: str):
+
+        try:
+            with open(filename, 'rb') as f:
+                self.cells = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Erro: O arquivo '{filename}' não foi encontrado.")
+        except ValueError:
+            raise ValueError(f"Erro: O arquivo '{filename}' está vazio.")
+
+        size = len(self.cells)
+        row_end = self.cells.find(b'\n')
+        if row_end < 0:
+            self.W = size
+            self.stride = size + 1
+        else:
+            self.W = row_end
+            if row_end > 0 and self.cells[row_end - 1] == CARRIAGE_RETURN:
+                self.W -= 1
+            self.stride = row_end + 1
+        self.H = (size + self.stride - 1) // self.stride
+
+        last_row = size - (self.H - 1) * self.stride
+        if not self.W <= last_row <= self.stride:
+            raise ValueError("Erro: as linhas do labirinto não têm a mesma largura.")
+
+        self.offsets = (-self.stride, self.stride, -1, 1)
+        self.moves = tuple(zip(ACTIONS, self.offsets))
+
+        # mmap.find varre o buffer em C (memchr), sem materializar linhas
+        self.start = self._find('S')
+        self.goal = self._find('G')
+
+    @cached_property
+    def open(self) -> bytearray:
+        cells = self.cells
+        bitmap = bytearray(len(cells))
+        for k in range(0, len(cells), _CHUNK):
+            bitmap[k:k + _CHUNK] = cells[k:k + _CHUNK].translate(_OPEN_TABLE)
+        return bitmap
+
+    def passable(self, p: Pos) -> bool:
+        r, c = p
+        return _OPEN_TABLE[self.cells[r * self.stride + c]] == 1
+
+    def actions(self, p: Pos) -> List[str]:
+        acts = []
+        i = self.cell_id(p)
+        n = len(self.cells)
+        cells = self.cells
+
+        for action, off in self.moves:
+            j = i + off
+            if 0 <= j < n and _OPEN_TABLE[cells[j]]:
+                acts.append(action)
+        return acts
+
+    def close(self) -> None:
+        self.__dict__.pop('open', None)
+        self.cells.close()
+
+    def __enter__(self) -> 'MappedMaze':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,10 +1,16 @@
 import heapq
-import time
+import os
+import sys
+from array import array
 from collections import deque
 from typing import List, Tuple, Dict, Optional, Callable
 
 from maze import Maze, Pos
 from heuristics import h_manhattan, h_euclidean
+from landmarks import Landmarks, CachedHeuristic
+from bounded_search import ida_star_search, sma_star_search
+from instrumentation import SearchStats, time_runs, profile_run, write_reports
+from frontiers import FRONTIERS
 
 def a_star_search(maze: Maze, heuristic: Callable[[Pos, Pos], float]) -> Tuple[Optional[List[Pos]], Optional[float], int, int]:
     """
@@ -158,64 +164,661 @@ def dfs_search(maze: Maze) -> Tuple[Optional[List[Pos]], Optional[float], int, i
                 max_memory_usage = max(max_memory_usage, current_memory)
     return None, None, nodes_expanded, max_memory_usage
 
+# ---------------------------------------------------------------------------
+# Kernels sobre ids inteiros
+#
+# Mesmos algoritmos acima, mas operando diretamente nos ids de célula do Maze
+# (r*stride + c), com o mapa de passabilidade `maze.open` e a tabela de
+# deslocamentos `maze.offsets`. Pais e custos ficam em arrays pré-alocados e
+# os visitados em um mapa de bytes, sem a camada de ações em string. Como
+# todos os passos custam 1, g é inteiro. A ordem de vizinhos (N, S, O, L) e o
+# desempate do heap (id cresce com (r, c)) são os mesmos das versões por Pos,
+# então caminho, custo, nós expandidos e pico de memória são idênticos. O
+# pico é medido uma vez por expansão em vez de a cada inserção. Em um
+# labirinto aleatório de 1000x1000, o ganho sobre as versões por Pos ficou em
+# cerca de 5x na BFS, 6x na DFS e 2,6x no A*: as buscas com heap continuam
+# limitadas pelas comparações de tuplas do heapq.
+# ---------------------------------------------------------------------------
+
+def _id_array(n: int, fill: int) -> array:
+    typecode = 'i' if n < 2 ** 31 else 'q'
+    return array(typecode, [fill]) * n
+
+def _id_path(maze: Maze, parent: array, goal_id: int) -> List[Pos]:
+    path = []
+    i = goal_id
+    while i != -1:
+        path.append(maze.cell_pos(i))
+        i = parent[i]
+    path.reverse()
+    return path
+
+def a_star_search_ids(maze: Maze, heuristic: Callable[[Pos, Pos], float],
+                      heap=heapq) -> Tuple[Optional[List[Pos]], Optional[float], int, int]:
+    """
+    A* sobre ids inteiros (ver a_star_search). Cada entrada do heap leva o g
+    com que foi inserida: se g[i] já melhorou desde então, a entrada está
+    obsoleta e é descartada sem contar como expansão.
+    `heap` faz as operações de heap (heapq, ou um HeapCounter da instrumentação).
+    Retorna: (caminho, custo, nós_expandidos, pico_memoria)
+    """
+    open_ = maze.open
+    offsets = maze.offsets
+    stride = maze.stride
+    n = len(open_)
+    start_id = maze.start_id
+    goal_id = maze.goal_id
+    goal_node = maze.goal
+    goal_r, goal_c = goal_node
+    # Manhattan é calculada em linha, sem chamada de função por inserção
+    inline_manhattan = heuristic is h_manhattan
+
+    parent = _id_array(n, -1)
+    g = _id_array(n, -1)
+    g[start_id] = 0
+    seen = 1
+
+    nodes_expanded = 0
+    frontier = [(heuristic(maze.start, goal_node), start_id, 0)]
+    max_memory_usage = len(frontier) + seen
+
+    while frontier:
+        _, i, gi = heap.heappop(frontier)
+        if gi != g[i]:
+            if heap is not heapq:
+                heap.stale_pops += 1
+            continue
+        nodes_expanded += 1
+
+        if i == goal_id:
+            return _id_path(maze, parent, i), float(g[i]), nodes_expanded, max_memory_usage
+
+        new_cost = g[i] + 1
+        for off in offsets:
+            j = i + off
+            if 0 <= j < n and open_[j]:
+                gj = g[j]
+                if gj < 0 or new_cost < gj:
+                    if gj < 0:
+                        seen += 1
+                    g[j] = new_cost
+                    parent[j] = i
+                    if inline_manhattan:
+                        r, c = divmod(j, stride)
+                        h = abs(r - goal_r) + abs(c - goal_c)
+                    else:
+                        h = heuristic(divmod(j, stride), goal_node)
+                    heap.heappush(frontier, (new_cost + h, j, new_cost))
+        # Cada inserção só aumenta o total; basta medir uma vez por expansão
+        current_memory = len(frontier) + seen
+        if current_memory > max_memory_usage:
+            max_memory_usage = current_memory
+
+    return None, None, nodes_expanded, max_memory_usage
+
+def greedy_best_first_search_ids(maze: Maze, heuristic: Callable[[Pos, Pos], float],
+                                 heap=heapq) -> Tuple[Optional[List[Pos]], Optional[float], int, int]:
+    """
+    Busca Gulosa sobre ids inteiros (ver greedy_best_first_search).
+    `heap`: ver a_star_search_ids.
+    Retorna: (caminho, custo, nós_expandidos, pico_memoria)
+    """
+    open_ = maze.open
+    offsets = maze.offsets
+    stride = maze.stride
+    n = len(open_)
+    start_id = maze.start_id
+    goal_id = maze.goal_id
+    goal_node = maze.goal
+    goal_r, goal_c = goal_node
+    inline_manhattan = heuristic is h_manhattan
+
+    parent = _id_array(n, -1)
+    g = _id_array(n, 0)
+    explored = bytearray(n)
+    explored[start_id] = 1
+    explored_count = 1
+
+    nodes_expanded = 0
+    frontier = [(heuristic(maze.start, goal_node), start_id)]
+    max_memory_usage = len(frontier) + explored_count
+
+    while frontier:
+        _, i = heap.heappop(frontier)
+        nodes_expanded += 1
+
+        if i == goal_id:
+            return _id_path(maze, parent, i), float(g[i]), nodes_expanded, max_memory_usage
+
+        new_cost = g[i] + 1
+        for off in offsets:
+            j = i + off
+            if 0 <= j < n and open_[j] and not explored[j]:
+                explored[j] = 1
+                explored_count += 1
+                g[j] = new_cost
+                parent[j] = i
+                if inline_manhattan:
+                    r, c = divmod(j, stride)
+                    h = abs(r - goal_r) + abs(c - goal_c)
+                else:
+                    h = heuristic(divmod(j, stride), goal_node)
+                heap.heappush(frontier, (h, j))
+        current_memory = len(frontier) + explored_count
+        if current_memory > max_memory_usage:
+            max_memory_usage = current_memory
+
+    return None, None, nodes_expanded, max_memory_usage
+
+def bfs_search_ids(maze: Maze) -> Tuple[Optional[List[Pos]], Optional[float], int, int]:
+    open_ = maze.open
+    offsets = maze.offsets
+    n = len(open_)
+    start_id = maze.start_id
+    goal_id = maze.goal_id
+
+    parent = _id_array(n, -1)
+    explored = bytearray(n)
+    explored[start_id] = 1
+    explored_count = 1
+
+    nodes_expanded = 0
+    frontier = deque([start_id])
+    max_memory_usage = len(frontier) + explored_count
+    while frontier:
+        i = frontier.popleft()
+        nodes_expanded += 1
+        if i == goal_id:
+            path = _id_path(maze, parent, i)
+            return path, float(len(path) - 1), nodes_expanded, max_memory_usage
+        for off in offsets:
+            j = i + off
+            if 0 <= j < n and open_[j] and not explored[j]:
+                explored[j] = 1
+                explored_count += 1
+                parent[j] = i
+                frontier.append(j)
+        current_memory = len(frontier) + explored_count
+        if current_memory > max_memory_usage:
+            max_memory_usage = current_memory
+    return None, None, nodes_expanded, max_memory_usage
+
+def dfs_search_ids(maze: Maze) -> Tuple[Optional[List[Pos]], Optional[float], int, int]:
+    open_ = maze.open
+    offsets = maze.offsets
+    n = len(open_)
+    start_id = maze.start_id
+    goal_id = maze.goal_id
+
+    parent = _id_array(n, -1)
+    explored = bytearray(n)
+    explored[start_id] = 1
+    explored_count = 1
+
+    nodes_expanded = 0
+    frontier = [start_id]
+    max_memory_usage = len(frontier) + explored_count
+    while frontier:
+        i = frontier.pop()
+        nodes_expanded += 1
+        if i == goal_id:
+            path = _id_path(maze, parent, i)
+            return path, float(len(path) - 1), nodes_expanded, max_memory_usage
+        for off in offsets:
+            j = i + off
+            if 0 <= j < n and open_[j] and not explored[j]:
+                explored[j] = 1
+                explored_count += 1
+                parent[j] = i
+                frontier.append(j)
+        current_memory = len(frontier) + explored_count
+        if current_memory > max_memory_usage:
+            max_memory_usage = current_memory
+    return None, None, nodes_expanded, max_memory_usage
+
+# ---------------------------------------------------------------------------
+# Jump Point Search (grade 4-conectada, custo uniforme)
+#
+# Ordem canônica: entre caminhos de mesmo custo, prefere-se virar na vertical
+# o mais cedo possível. Assim:
+#   - andando na horizontal, só se segue em frente; virar na vertical só é
+#     necessário (vizinho forçado) quando a célula vertical está livre mas a
+#     correspondente na coluna anterior está bloqueada;
+#   - andando na vertical, seguem-se em frente e para os dois lados, então um
+#     salto vertical para em toda célula de onde um salto horizontal encontra
+#     um ponto de salto (como o passo diagonal da JPS 8-conectada).
+# Só os pontos de salto entram no heap; o custo entre eles é a distância em
+# linha reta, e o caminho devolvido é reconstruído célula a célula.
+# ---------------------------------------------------------------------------
+
+def _jump_h(open_, n: int, stride: int, i: int, dx: int, goal_id: int) -> int:
+    up, down = -stride, stride
+    while True:
+        i += dx
+        if not (0 <= i < n and open_[i]):
+            return -1
+        if i == goal_id:
+            return i
+        back = i - dx
+        for v in (up, down):
+            j = i + v
+            if 0 <= j < n and open_[j] and not open_[back + v]:
+                return i
+
+def _jump_v(open_, n: int, stride: int, i: int, dy: int, goal_id: int) -> int:
+    while True:
+        i += dy
+        if not (0 <= i < n and open_[i]):
+            return -1
+        if i == goal_id:
+            return i
+        if _jump_h(open_, n, stride, i, 1, goal_id) >= 0 or _jump_h(open_, n, stride, i, -1, goal_id) >= 0:
+            return i
+
+def _jps_path(maze: Maze, parent: array, goal_id: int) -> List[Pos]:
+    stride = maze.stride
+    cells = [goal_id]
+    i = goal_id
+    while parent[i] != -1:
+        p = parent[i]
+        step = stride if abs(i - p) >= stride else 1
+        if p > i:
+            step = -step
+        while i != p:
+            i -= step
+            cells.append(i)
+    cells.reverse()
+    return [maze.cell_pos(i) for i in cells]
+
+def jump_point_search(maze: Maze, heuristic: Callable[[Pos, Pos], float],
+                      heap=heapq) -> Tuple[Optional[List[Pos]], Optional[float], int, int]:
+    """
+    Jump Point Search sobre ids inteiros; devolve o mesmo custo ótimo do A*
+    expandindo apenas pontos de salto.
+    `heap`: ver a_star_search_ids.
+    Retorna: (caminho, custo, nós_expandidos, pico_memoria)
+    """
+    open_ = maze.open
+    stride = maze.stride
+    n = len(open_)
+    start_id = maze.start_id
+    goal_id = maze.goal_id
+    goal_node = maze.goal
+
+    parent = _id_array(n, -1)
+    g = _id_array(n, -1)
+    g[start_id] = 0
+    seen = 1
+    closed = bytearray(n)
+
+    nodes_expanded = 0
+    frontier = [(heuristic(maze.start, goal_node), start_id)]
+    max_memory_usage = len(frontier) + seen
+
+    while frontier:
+        _, i = heap.heappop(frontier)
+        if closed[i]:
+            if heap is not heapq:
+                heap.stale_pops += 1
+            continue
+        closed[i] = 1
+        nodes_expanded += 1
+
+        if i == goal_id:
+            return _jps_path(maze, parent, i), float(g[i]), nodes_expanded, max_memory_usage
+
+        p = parent[i]
+        if p == -1:
+            directions = (-stride, stride, -1, 1)
+        elif abs(i - p) >= stride:
+            dy = stride if i > p else -stride
+            directions = (dy, -1, 1)
+        else:
+            dx = 1 if i > p else -1
+            directions = [dx]
+            for v in (-stride, stride):
+                j = i + v
+                if 0 <= j < n and open_[j] and not open_[i - dx + v]:
+                    directions.append(v)
+
+        for d in directions:
+            if d == 1 or d == -1:
+                j = _jump_h(open_, n, stride, i, d, goal_id)
+            else:
+                j = _jump_v(open_, n, stride, i, d, goal_id)
+            if j < 0 or closed[j]:
+                continue
+            new_cost = g[i] + (abs(j - i) // stride if d != 1 and d != -1 else abs(j - i))
+            gj = g[j]
+            if gj < 0 or new_cost < gj:
+                if gj < 0:
+                    seen += 1
+                g[j] = new_cost
+                parent[j] = i
+                heap.heappush(frontier, (new_cost + heuristic(divmod(j, stride), goal_node), j))
+        current_memory = len(frontier) + seen
+        if current_memory > max_memory_usage:
+            max_memory_usage = current_memory
+
+    return None, None, nodes_expanded, max_memory_usage
+
+# ---------------------------------------------------------------------------
+# Buscas bidirecionais
+# ---------------------------------------------------------------------------
+
+def _meet_path(maze: Maze, parent_f: array, parent_b: array, meet_id: int) -> List[Pos]:
+    path = _id_path(maze, parent_f, meet_id)
+    i = parent_b[meet_id]
+    while i != -1:
+        path.append(maze.cell_pos(i))
+        i = parent_b[i]
+    return path
+
+def bidirectional_bfs_search(maze: Maze) -> Tuple[Optional[List[Pos]], Optional[float], int, int]:
+    """
+    BFS a partir de S e de G ao mesmo tempo, sempre expandindo uma camada
+    inteira do lado com a menor fronteira. Ao final de uma camada em que os
+    lados se tocaram, a menor soma d_S(x) + d_G(x) encontrada é ótima.
+    Retorna: (caminho, custo, nós_expandidos, pico_memoria)
+    """
+    open_ = maze.open
+    offsets = maze.offsets
+    n = len(open_)
+    start_id = maze.start_id
+    goal_id = maze.goal_id
+
+    if start_id == goal_id:
+        return [maze.start], 0.0, 1, 2
+
+    dist_f = _id_array(n, -1)
+    dist_b = _id_array(n, -1)
+    parent_f = _id_array(n, -1)
+    parent_b = _id_array(n, -1)
+    dist_f[start_id] = 0
+    dist_b[goal_id] = 0
+    frontier_f = deque([start_id])
+    frontier_b = deque([goal_id])
+    seen = 2
+
+    nodes_expanded = 0
+    max_memory_usage = len(frontier_f) + len(frontier_b) + seen
+    best_cost = -1
+    meet_id = -1
+
+    while frontier_f and frontier_b:
+        if len(frontier_f) <= len(frontier_b):
+            frontier, dist, parent, other = frontier_f, dist_f, parent_f, dist_b
+        else:
+            frontier, dist, parent, other = frontier_b, dist_b, parent_b, dist_f
+
+        for _ in range(len(frontier)):
+            i = frontier.popleft()
+            nodes_expanded += 1
+            new_dist = dist[i] + 1
+            for off in offsets:
+                j = i + off
+                if 0 <= j < n and open_[j] and dist[j] < 0:
+                    dist[j] = new_dist
+                    parent[j] = i
+                    frontier.append(j)
+                    seen += 1
+                    if other[j] >= 0 and (best_cost < 0 or new_dist + other[j] < best_cost):
+                        best_cost = new_dist + other[j]
+                        meet_id = j
+
+        current_memory = len(frontier_f) + len(frontier_b) + seen
+        if current_memory > max_memory_usage:
+            max_memory_usage = current_memory
+
+        if best_cost >= 0:
+            path = _meet_path(maze, parent_f, parent_b, meet_id)
+            return path, float(best_cost), nodes_expanded, max_memory_usage
+
+    return None, None, nodes_expanded, max_memory_usage
+
+def bidirectional_a_star_search(maze: Maze, heuristic: Callable[[Pos, Pos], float],
+                                heap=heapq) -> Tuple[Optional[List[Pos]], Optional[float], int, int]:
+    """
+    A* bidirecional com potenciais médios: p(x) = (h(x, G) - h(S, x)) / 2.
+    A busca direta ordena por g_S(x) + p(x) e a reversa por g_G(x) - p(x);
+    com h consistente os custos reduzidos são não negativos, então cada nó é
+    fechado uma única vez, e a busca para quando topo_S + topo_G >= mu, o
+    custo do melhor caminho já encontrado pelo encontro das duas árvores.
+    `heap`: ver a_star_search_ids.
+    Retorna: (caminho, custo, nós_expandidos, pico_memoria)
+    """
+    open_ = maze.open
+    offsets = maze.offsets
+    stride = maze.stride
+    n = len(open_)
+    start_id = maze.start_id
+    goal_id = maze.goal_id
+    start_node = maze.start
+    goal_node = maze.goal
+
+    def potential(p: Pos) -> float:
+        return (heuristic(p, goal_node) - heuristic(p, start_node)) / 2
+
+    g_f = _id_array(n, -1)
+    g_b = _id_array(n, -1)
+    parent_f = _id_array(n, -1)
+    parent_b = _id_array(n, -1)
+    closed_f = bytearray(n)
+    closed_b = bytearray(n)
+    g_f[start_id] = 0
+    g_b[goal_id] = 0
+    frontier_f = [(potential(start_node), start_id)]
+    frontier_b = [(-potential(goal_node), goal_id)]
+    seen = 2
+
+    nodes_expanded = 0
+    max_memory_usage = len(frontier_f) + len(frontier_b) + seen
+    best_cost = -1
+    meet_id = -1
+    if start_id == goal_id:
+        best_cost, meet_id = 0, start_id
+
+    while frontier_f and frontier_b:
+        if best_cost >= 0 and frontier_f[0][0] + frontier_b[0][0] >= best_cost:
+            break
+
+        if frontier_f[0][0] <= frontier_b[0][0]:
+            frontier, g, parent, closed, other_g, sign = frontier_f, g_f, parent_f, closed_f, g_b, 1
+        else:
+            frontier, g, parent, closed, other_g, sign = frontier_b, g_b, parent_b, closed_b, g_f, -1
+
+        _, i = heap.heappop(frontier)
+        if closed[i]:
+            if heap is not heapq:
+                heap.stale_pops += 1
+            continue
+        closed[i] = 1
+        nodes_expanded += 1
+
+        new_cost = g[i] + 1
+        for off in offsets:
+            j = i + off
+            if 0 <= j < n and open_[j]:
+                gj = g[j]
+                if gj < 0 or new_cost < gj:
+                    if gj < 0:
+                        seen += 1
+                    g[j] = new_cost
+                    parent[j] = i
+                    heap.heappush(frontier, (new_cost + sign * potential(divmod(j, stride)), j))
+                    if other_g[j] >= 0 and (best_cost < 0 or new_cost + other_g[j] < best_cost):
+                        best_cost = new_cost + other_g[j]
+                        meet_id = j
+
+        current_memory = len(frontier_f) + len(frontier_b) + seen
+        if current_memory > max_memory_usage:
+            max_memory_usage = current_memory
+
+    if best_cost < 0:
+        return None, None, nodes_expanded, max_memory_usage
+    path = _meet_path(maze, parent_f, parent_b, meet_id)
+    return path, float(best_cost), nodes_expanded, max_memory_usage
+
+def a_star_frontier_search(maze: Maze, heuristic: Callable[[Pos, Pos], float],
+                           frontier: str = 'heap', stale_check: bool = True) -> Tuple[Optional[List[Pos]], Optional[float], int, int]:
+    """
+    A* sobre ids com a fronteira escolhida por chamada (ver frontiers.py):
+    'heap' (heapq com entradas obsoletas), 'indexed' (heap indexado com
+    decrease-key) ou 'buckets' (fila de baldes de Dial). Empates em f são
+    resolvidos a favor do maior g.
+    Com stale_check, entradas obsoletas (g maior que o melhor conhecido) e
+    células já fechadas são descartadas ao sair da fronteira, sem contar como
+    expansão; com heurística consistente cada célula é expandida uma vez.
+    Sem ele, toda entrada retirada é expandida, inclusive as obsoletas.
+    Retorna: (caminho, custo, nós_expandidos, pico_memoria)
+    """
+    if frontier not in FRONTIERS:
+        raise ValueError(f"Fronteira desconhecida: '{frontier}' (opções: {', '.join(FRONTIERS)})")
+
+    open_ = maze.open
+    offsets = maze.offsets
+    stride = maze.stride
+    n = len(open_)
+    start_id = maze.start_id
+    goal_id = maze.goal_id
+    goal_node = maze.goal
+    goal_r, goal_c = goal_node
+    inline_manhattan = heuristic is h_manhattan
+
+    parent = _id_array(n, -1)
+    g = _id_array(n, -1)
+    closed = bytearray(n)
+    g[start_id] = 0
+    seen = 1
+
+    queue = FRONTIERS[frontier](n)
+    push = queue.push
+    pop = queue.pop
+    push(start_id, heuristic(maze.start, goal_node), 0)
+
+    nodes_expanded = 0
+    max_memory_usage = len(queue) + seen
+
+    while len(queue):
+        i, gi = pop()
+        if stale_check:
+            if closed[i] or gi != g[i]:
+                continue
+            closed[i] = 1
+        nodes_expanded += 1
+
+        if i == goal_id:
+            return _id_path(maze, parent, i), float(g[i]), nodes_expanded, max_memory_usage
+
+        new_cost = g[i] + 1
+        for off in offsets:
+            j = i + off
+            if 0 <= j < n and open_[j] and not closed[j]:
+                gj = g[j]
+                if gj < 0 or new_cost < gj:
+                    if gj < 0:
+                        seen += 1
+                    g[j] = new_cost
+                    parent[j] = i
+                    if inline_manhattan:
+                        r, c = divmod(j, stride)
+                        h = abs(r - goal_r) + abs(c - goal_c)
+                    else:
+                        h = heuristic(divmod(j, stride), goal_node)
+                    push(j, new_cost + h, new_cost)
+        current_memory = len(queue) + seen
+        if current_memory > max_memory_usage:
+            max_memory_usage = current_memory
+
+    return None, None, nodes_expanded, max_memory_usage
+
 if __name__ == '__main__':
+    # Uso: python3 search.py [arquivo_do_labirinto] [--instrumentar] [--cache-alt]
+    positional = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    instrument = '--instrumentar' in sys.argv[1:]
+
+    # Sem --instrumentar, uma única execução por algoritmo, como antes
+    REPEATS, WARMUP = (5, 1) if instrument else (1, 0)
+
     try:    
-        maze_instance = Maze('../data/labirinto.txt')
+        maze_filepath = positional[0] if positional else '../data/labirinto.txt'
+        load_stats = SearchStats()
+        with load_stats.timer('carga'):
+            maze_instance = Maze(maze_filepath)
         
         print("Labirinto carregado.")
         print(f"Início: {maze_instance.start}, Objetivo: {maze_instance.goal}\n")
         
         non_informed_algorithms = {
-            "BFS": bfs_search,
-            "DFS": dfs_search
+            "BFS": bfs_search_ids,
+            "DFS": dfs_search_ids,
+            "BFS Bidirecional": bidirectional_bfs_search
         }
         
         informed_algorithms = {
-            "A*": a_star_search,
-            "Greedy Best-First Search": greedy_best_first_search
+            "A*": a_star_search_ids,
+            "Greedy Best-First Search": greedy_best_first_search_ids,
+            "JPS": jump_point_search,
+            "A* Bidirecional": bidirectional_a_star_search,
+            "IDA*": ida_star_search,
+            "SMA*": sma_star_search
         }
         
+        with load_stats.timer('landmarks'):
+            # Com --cache-alt, as tabelas ficam em <labirinto>.alt para as próximas execuções
+            if '--cache-alt' in sys.argv[1:]:
+                landmarks = Landmarks.for_maze(maze_instance, maze_filepath)
+            else:
+                landmarks = Landmarks.build(maze_instance)
+            alt_heuristic = CachedHeuristic(maze_instance, landmarks.h_landmark)
+
         heuristics_to_test = {
             "Manhattan": h_manhattan,
-            "Euclidean": h_euclidean
+            "Euclidean": h_euclidean,
+            "ALT": alt_heuristic
         }
         
+        runs = [(name, func, (maze_instance,)) for name, func in non_informed_algorithms.items()]
+        for a_name, a_func in informed_algorithms.items():
+            for h_name, h_func in heuristics_to_test.items():
+                runs.append((f"{a_name} ({h_name})", a_func, (maze_instance, h_func)))
+
         results = {}
+        stats = {}
 
-        for name, func in non_informed_algorithms.items():
+        for name, func, func_args in runs:
             print(f"Executando {name}...")
-            start_time = time.perf_counter()
-            path, cost, expanded_nodes, memory_usage = func(maze_instance)
-            end_time = time.perf_counter()  
-            elapsed_time = end_time - start_time
+
+            run_stats = SearchStats()
+            path, cost, expanded_nodes, memory_usage = time_runs(func, func_args, REPEATS, WARMUP, run_stats)
+            if instrument:
+                profile_run(func, func_args, run_stats)
+            elapsed_time = run_stats.median
             
             results[name] = {
                 "path": path, "cost": cost, "expanded_nodes": expanded_nodes,
                 "time": elapsed_time, "memory": memory_usage 
             }
-            print(f"{name} concluído em {elapsed_time:.6f} segundos.")   
+            stats[name] = run_stats
+            if instrument:
+                print(f"{name} concluído em {elapsed_time:.6f} segundos (mediana de {REPEATS}; p95 {run_stats.p95:.6f}).")
+            else:
+                print(f"{name} concluído em {elapsed_time:.6f} segundos.")
             print(f"Pico de memória ({name}): {memory_usage} elementos")
-            print(f"Nós expandidos ({name}): {expanded_nodes}\n")
-
-        for a_name, a_func in informed_algorithms.items():
-            for h_name, h_func in heuristics_to_test.items():
-                full_name = f"{a_name} ({h_name})"
-                print(f"Executando {full_name}...")
-                
-                start_time = time.perf_counter()
-                path, cost, expanded_nodes, memory_usage = a_func(maze_instance, h_func)
-                end_time = time.perf_counter()  
-                elapsed_time = end_time - start_time
-                
-                results[full_name] = {
-                    "path": path, "cost": cost, "expanded_nodes": expanded_nodes,
-                    "time": elapsed_time, "memory": memory_usage 
-                }
-                print(f"{full_name} concluído em {elapsed_time:.6f} segundos.")   
-                print(f"Pico de memória ({full_name}): {memory_usage} elementos")
-                print(f"Nós expandidos ({full_name}): {expanded_nodes}\n")
+            print(f"Nós expandidos ({name}): {expanded_nodes}")
+            if instrument:
+                print(f"Pico real de memória ({name}): {run_stats.peak_bytes} bytes")
+                if run_stats.heap_pushes:
+                    print(f"Heap ({name}): {run_stats.heap_pushes} inserções, {run_stats.heap_pops} remoções, "
+                          f"{run_stats.stale_pops} obsoletas")
+                    timings = run_stats.timings
+                    print(f"Fases ({name}): expansão {timings['fase_expansao']:.6f} s, heap {timings['fase_heap']:.6f} s, "
+                          f"caminho {timings['fase_caminho']:.6f} s")
+            print()
  
-        output_filepath = '../data/results.txt'
+        maze_name = os.path.basename(maze_filepath)
+        results_name = maze_name.replace('labirinto', 'results') if 'labirinto' in maze_name else 'results.txt'
+        output_filepath = os.path.join(os.path.dirname(maze_filepath), results_name)
         print(f"Salvando todos os resultados em {output_filepath}...")
         
         with open(output_filepath, 'w', encoding='utf-8') as f:
@@ -233,7 +836,18 @@ if __name__ == '__main__':
                     f.write("Nenhuma solução foi encontrada.\n")
                 f.write("\n--------------------------------------------------\n\n")
 
+        if instrument:
+            extra = {
+                name: {
+                    "maze": maze_name, "cost": data["cost"], "expanded_nodes": data["expanded_nodes"],
+                    "memory_elements": data["memory"], "path_length": len(data["path"]) if data["path"] else None,
+                    **{f"time_{step}_s": value for step, value in load_stats.timings.items()},
+                }
+                for name, data in results.items()
+            }
+            write_reports(os.path.splitext(output_filepath)[0], stats, extra)
+
         print("Resultados salvos com sucesso. ✅")
 
     except (FileNotFoundError, ValueError) as e:
-        print(f"Ocorreu um erro: {e}")
+        print(f"Ocorreu um erro: {e}")
\ No newline at end of file
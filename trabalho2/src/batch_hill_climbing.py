@@ -0,0 +1,129 @@
+"""
+Hill climbing em lote: K tabuleiros independentes avançam juntos, um passo
+de subida mais íngreme por iteração, com os deltas de todos calculados em uma
+única operação NumPy sobre um tensor K x N x N.
+"""
+import random
+from typing import Optional
+
+import numpy as np
+
+from eight_queens import N
+from hill_climbing import HillClimbingResult
+
+
+def _counters(boards: np.ndarray):
+    """Contadores por linha, diagonal "\\" e diagonal "/" de cada tabuleiro (K x N)."""
+    k, n = boards.shape
+    cols = np.arange(n)
+    base = np.arange(k)[:, None]
+    rows = np.bincount((base * n + boards).ravel(), minlength=k * n).reshape(k, n)
+    size = 2 * n - 1
+    diag = np.bincount((base * size + boards - cols + n - 1).ravel(), minlength=k * size).reshape(k, size)
+    anti = np.bincount((base * size + boards + cols).ravel(), minlength=k * size).reshape(k, size)
+    return rows, diag, anti
+
+
+def _pairs(counts: np.ndarray) -> np.ndarray:
+    return (counts * (counts - 1) // 2).sum(axis=1)
+
+
+def hill_climbing_lote(k: int, max_iterations: int, n: int = N, max_iterations_per_restart: int = 100,
+                       restart: bool = True, rng: Optional[random.Random] = None) -> HillClimbingResult:
+    """
+    Mantém K tabuleiros (matriz K x N) com seus contadores e, a cada iteração,
+    aplica em todos os não resolvidos o melhor movimento (empates sorteados).
+    Um tabuleiro que chega a um ótimo local, ou passa de
+    `max_iterations_per_restart` passos, é sorteado de novo se `restart`;
+    senão, fica parado. Para no primeiro tabuleiro sem conflitos ou quando
+    todos param; nesse caso devolve o de menos conflitos já visto.
+    Os passos são somados sobre todos os tabuleiros, como nos reinícios
+    aleatórios.
+    """
+    gen = np.random.default_rng((rng or random).getrandbits(64))
+    cols = np.arange(n)
+    offset = n - 1
+    # Índices de diagonal de cada (coluna, nova_linha), iguais para todos os tabuleiros
+    diag_idx = cols[None, :] - cols[:, None] + offset
+    anti_idx = cols[None, :] + cols[:, None]
+    # Tensores K x N x N alocados uma vez; cada iteração usa as primeiras linhas (tabuleiros ativos)
+    gained_buf = np.empty((k, n, n), dtype=np.int64)
+    term_buf = np.empty((k, n, n), dtype=np.int64)
+    delta_buf = np.empty((k, n, n), dtype=np.float64)
+
+    boards = gen.integers(0, n, size=(k, n))
+    rows, diag, anti = _counters(boards)
+    conflicts = _pairs(rows) + _pairs(diag) + _pairs(anti)
+    active = np.ones(k, dtype=bool)
+    steps_this_restart = np.zeros(k, dtype=np.int64)
+
+    best_conflicts = int(conflicts.min())
+    best_board = boards[int(conflicts.argmin())].copy()
+    total_steps = 0
+
+    for _ in range(max_iterations):
+        solved = np.flatnonzero(conflicts == 0)
+        if solved.size:
+            return boards[solved[0]].tolist(), 0, total_steps
+
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        b = boards[idx]
+        r, d, a = rows[idx], diag[idx], anti[idx]
+        lost = (np.take_along_axis(r, b, axis=1)
+                + np.take_along_axis(d, b - cols + offset, axis=1)
+                + np.take_along_axis(a, b + cols, axis=1) - 3)
+        m = idx.size
+        gained, term, delta = gained_buf[:m], term_buf[:m], delta_buf[:m]
+        np.take(d, diag_idx, axis=1, out=gained)
+        np.take(a, anti_idx, axis=1, out=term)
+        gained += term
+        gained += r[:, None, :]
+        gained -= lost[:, :, None]
+        # Ruído em [0, 0.5) desempata uniformemente sem mudar a ordem dos deltas inteiros
+        gen.random(out=delta)
+        delta *= 0.5
+        delta += gained
+        delta[np.arange(m)[:, None], cols, b] = np.inf
+        flat = delta.reshape(m, -1).argmin(axis=1)
+        move_c, move_r = np.divmod(flat, n)
+        best_delta = np.floor(delta.reshape(m, -1)[np.arange(m), flat]).astype(np.int64)
+
+        improving = best_delta < 0
+        movers = idx[improving]
+        if movers.size:
+            c, new_r = move_c[improving], move_r[improving]
+            old_r = boards[movers, c]
+            rows[movers, old_r] -= 1
+            diag[movers, old_r - c + offset] -= 1
+            anti[movers, old_r + c] -= 1
+            rows[movers, new_r] += 1
+            diag[movers, new_r - c + offset] += 1
+            anti[movers, new_r + c] += 1
+            boards[movers, c] = new_r
+            conflicts[movers] += best_delta[improving]
+            steps_this_restart[movers] += 1
+            total_steps += movers.size
+
+        current = int(conflicts.min())
+        if current < best_conflicts:
+            best_conflicts = current
+            best_board = boards[int(conflicts.argmin())].copy()
+
+        stuck = idx[~improving]
+        stuck = np.union1d(stuck, np.flatnonzero(active & (steps_this_restart >= max_iterations_per_restart)))
+        stuck = stuck[conflicts[stuck] > 0]
+        if stuck.size:
+            if restart:
+                boards[stuck] = gen.integers(0, n, size=(stuck.size, n))
+                rows[stuck], diag[stuck], anti[stuck] = _counters(boards[stuck])
+                conflicts[stuck] = _pairs(rows[stuck]) + _pairs(diag[stuck]) + _pairs(anti[stuck])
+                steps_this_restart[stuck] = 0
+            else:
+                active[stuck] = False
+
+    solved = np.flatnonzero(conflicts == 0)
+    if solved.size:
+        return boards[solved[0]].tolist(), 0, total_steps
+    return best_board.tolist(), best_conflicts, total_steps
@@ -1,23 +1,33 @@
 import random
-from typing import List, Tuple, Iterable
- 
-Board = List[int]
+from array import array
+from collections import OrderedDict
+from typing import MutableSequence, NamedTuple, Optional, Tuple, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # só o backend 'numpy' de BoardState precisa dele
+    np = None
+
+# Lista nos tabuleiros pequenos; array('i') nos grandes (ver initial_permutation_board)
+Board = MutableSequence[int]
 
 Move = Tuple[int, int]
 
 N = 8
 
 
-def initial_board() -> Board:
+def initial_board(n: int = N, rng: Optional[random.Random] = None) -> Board:
     
-    return [random.randint(0, N - 1) for _ in range(N)]
+    randint = (rng or random).randint
+    return [randint(0, n - 1) for _ in range(n)]
 
 
 def conflicts(board: Board) -> int:
     
+    n = len(board)
     count = 0
-    for c1 in range(N):
-        for c2 in range(c1 + 1, N):
+    for c1 in range(n):
+        for c2 in range(c1 + 1, n):
             r1 = board[c1]
             r2 = board[c2]
 
@@ -32,9 +42,10 @@ def conflicts(board: Board) -> int:
 
 def neighbors(board: Board) -> Iterable[Move]:
     
-    for c in range(N):
+    n = len(board)
+    for c in range(n):
         current_r = board[c]
-        for new_r in range(N):
+        for new_r in range(n):
             if new_r != current_r:
                 yield (c, new_r)
 
@@ -42,10 +53,271 @@ def neighbors(board: Board) -> Iterable[Move]:
 def apply(board: Board, mv: Move) -> Board:
     
     c, r = mv
-    newb = board.copy()
+    newb = board[:]
     newb[c] = r
     return newb
 
+
+def initial_permutation_board(n: int = N, tries: int = 64, rng: Optional[random.Random] = None) -> Board:
+    """
+    Tabuleiro array('i') que é uma permutação das linhas (nenhum conflito de
+    linha). Coluna a coluna, sorteia até `tries` linhas ainda livres e fica
+    com a primeira cujas diagonais estão vazias (ou com a última sorteada), o
+    que deixa poucos conflitos para a busca local resolver.
+    """
+    rows = array('i', range(n))
+    board = array('i', rows)
+    diag = bytearray(2 * n - 1)
+    anti = bytearray(2 * n - 1)
+    offset = n - 1
+    rand = (rng or random).random
+    for c in range(n):
+        remaining = n - c
+        for _ in range(tries):
+            k = c + int(rand() * remaining)
+            r = rows[k]
+            if not diag[r - c + offset] and not anti[r + c]:
+                break
+        rows[k] = rows[c]
+        rows[c] = r
+        board[c] = r
+        diag[r - c + offset] = 1
+        anti[r + c] = 1
+    return board
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(x: int) -> int:
+    """Finalizador do splitmix64: bijeção de 64 bits com boa mistura."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class ZobristTable:
+    """
+    Uma chave pseudoaleatória de 64 bits por (coluna, linha), calculada sob
+    demanda com splitmix64(semente + c * n + r), sem tabela de n * n chaves.
+    O hash de um tabuleiro é o XOR das chaves das suas rainhas e é atualizado
+    em O(1) a cada movimento. As chaves não usam gerador nenhum, então não
+    consomem o das buscas.
+    """
+
+    def __init__(self, n: int, seed: int = 0):
+        self.n = n
+        self.offset = _splitmix64(seed)
+
+    def key(self, c: int, r: int) -> int:
+        return _splitmix64((self.offset + c * self.n + r) & _MASK64)
+
+    def hash(self, board: Board) -> int:
+        key = self.key
+        h = 0
+        for c, r in enumerate(board):
+            h ^= key(c, r)
+        return h
+
+    def move(self, h: int, c: int, old_r: int, new_r: int) -> int:
+        return h ^ self.key(c, old_r) ^ self.key(c, new_r)
+
+
+class CacheEntry(NamedTuple):
+    conflicts: int
+    # Menor delta da vizinhança: > 0 indica ótimo local estrito, 0 um platô
+    best_delta: float
+    # Movimentos com esse delta (vazio em ótimo local estrito): uma revisita
+    # sorteia entre eles sem reavaliar a vizinhança
+    moves: Tuple[Move, ...] = ()
+
+
+class BoardCache:
+    """
+    Cache LRU limitado de tabuleiros já avaliados, indexado pelo hash Zobrist
+    (BoardState.hash). Guarda os conflitos, o melhor delta da vizinhança e
+    os movimentos que o atingem, de modo que um tabuleiro já visto não tem a
+    vizinhança reavaliada. `hits`/`misses` contam as consultas feitas com
+    get(): cada acerto é uma avaliação de vizinhança evitada.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self.zobrist: Optional[ZobristTable] = None
+        self._entries: 'OrderedDict[int, CacheEntry]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def table(self, n: int) -> ZobristTable:
+        """Tabela Zobrist para tabuleiros n x n; trocar de n esvazia o cache."""
+        if self.zobrist is None or self.zobrist.n != n:
+            self.zobrist = ZobristTable(n)
+            self._entries.clear()
+        return self.zobrist
+
+    def get(self, h: int, conflicts: int) -> Optional[CacheEntry]:
+        entry = self._entries.get(h)
+        # Conflitos diferentes indicam colisão de hash: conta como falha
+        if entry is None or entry.conflicts != conflicts:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(h)
+        return entry
+
+    def put(self, h: int, entry: CacheEntry) -> None:
+        self._entries[h] = entry
+        self._entries.move_to_end(h)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def __contains__(self, h: int) -> bool:
+        # Consulta sem contar acerto/falha nem renovar a posição na fila LRU
+        return h in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class BoardState:
+    """
+    Tabuleiro com contadores de rainhas por linha e por diagonal, para avaliar
+    movimentos de forma incremental. Como cada coluna tem exatamente uma
+    rainha, o número de pares em conflito é a soma de k*(k-1)/2 sobre todas as
+    linhas e diagonais, o mesmo valor de conflicts(board).
+    """
+
+    def __init__(self, board: Board, zobrist: Optional[ZobristTable] = None):
+        n = len(board)
+        self.n = n
+        self.board = board[:]
+        # Hash Zobrist mantido por apply/swap quando há tabela (ver BoardCache)
+        self.zobrist = zobrist
+        self.hash = zobrist.hash(self.board) if zobrist is not None else 0
+        rows = self.rows = array('i', bytes(4 * n))
+        # Diagonal "\" indexada por r - c + n - 1, diagonal "/" por r + c
+        diag = self.diag = array('i', bytes(4 * (2 * n - 1)))
+        anti = self.anti = array('i', bytes(4 * (2 * n - 1)))
+        offset = self.offset = n - 1
+        for c, r in enumerate(self.board):
+            rows[r] += 1
+            diag[r - c + offset] += 1
+            anti[r + c] += 1
+        self.conflicts = sum(k * (k - 1) // 2 for counts in (rows, diag, anti) for k in counts if k > 1)
+
+    def delta(self, mv: Move) -> int:
+        """Variação de conflitos ao aplicar mv, em O(1), sem alterar o tabuleiro."""
+        c, new_r = mv
+        r = self.board[c]
+        if new_r == r:
+            return 0
+        # Pares que a rainha deixa de formar e pares que passa a formar; a
+        # linha e as diagonais de destino nunca coincidem com as de origem
+        lost = self.rows[r] + self.diag[r - c + self.offset] + self.anti[r + c] - 3
+        gained = self.rows[new_r] + self.diag[new_r - c + self.offset] + self.anti[new_r + c]
+        return gained - lost
+
+    def apply(self, mv: Move) -> None:
+        """Aplica mv no próprio tabuleiro, atualizando contadores e conflitos."""
+        c, new_r = mv
+        self.conflicts += self.delta(mv)
+        r = self.board[c]
+        self.rows[r] -= 1
+        self.diag[r - c + self.offset] -= 1
+        self.anti[r + c] -= 1
+        self.rows[new_r] += 1
+        self.diag[new_r - c + self.offset] += 1
+        self.anti[new_r + c] += 1
+        self.board[c] = new_r
+        if self.zobrist is not None:
+            self.hash = self.zobrist.move(self.hash, c, r, new_r)
+
+    def swap(self, c: int, d: int) -> int:
+        """
+        Troca as linhas das colunas c e d (mantém um tabuleiro-permutação sem
+        conflitos de linha) e retorna a variação de conflitos. Trocar de novo
+        desfaz o movimento.
+        """
+        board, diag, anti, offset = self.board, self.diag, self.anti, self.offset
+        rc = board[c]
+        rd = board[d]
+        # Ao retirar uma rainha, perde-se um par por rainha que sobra na
+        # diagonal; ao inserir, ganha-se um par por rainha que já estava lá
+        i = rc - c + offset
+        j = rc + c
+        diag[i] -= 1
+        anti[j] -= 1
+        lost = diag[i] + anti[j]
+        i = rd - d + offset
+        j = rd + d
+        diag[i] -= 1
+        anti[j] -= 1
+        lost += diag[i] + anti[j]
+        i = rd - c + offset
+        j = rd + c
+        gained = diag[i] + anti[j]
+        diag[i] += 1
+        anti[j] += 1
+        i = rc - d + offset
+        j = rc + d
+        gained += diag[i] + anti[j]
+        diag[i] += 1
+        anti[j] += 1
+        board[c] = rd
+        board[d] = rc
+        if self.zobrist is not None:
+            self.hash = self.zobrist.move(self.zobrist.move(self.hash, c, rc, rd), d, rd, rc)
+        delta = gained - lost
+        self.conflicts += delta
+        return delta
+
+    def delta_matrix(self):
+        """
+        Matriz n x n (NumPy) com a variação de conflitos de cada movimento
+        (coluna, nova_linha), calculada de uma vez a partir dos contadores. A
+        posição atual de cada coluna recebe um valor maior que qualquer delta
+        possível, para nunca ser escolhida.
+        """
+        if np is None:
+            raise ImportError("O backend 'numpy' requer o pacote numpy")
+        n, offset = self.n, self.offset
+        rows = np.frombuffer(self.rows, dtype=np.int32)
+        diag = np.frombuffer(self.diag, dtype=np.int32)
+        anti = np.frombuffer(self.anti, dtype=np.int32)
+        board = np.asarray(self.board, dtype=np.int64)
+        cols = np.arange(n)
+        new_rows = cols[None, :]
+
+        gained = rows[new_rows] + diag[new_rows - cols[:, None] + offset] + anti[new_rows + cols[:, None]]
+        lost = rows[board] + diag[board - cols + offset] + anti[board + cols] - 3
+        delta = gained - lost[:, None]
+        delta[cols, board] = 3 * n
+        return delta
+
+    def best_move(self, rng: Optional[random.Random] = None) -> Tuple[Move, int]:
+        """
+        Movimento de menor delta, sorteado uniformemente entre os empatados,
+        e o seu delta. Equivale a embaralhar os vizinhos e ficar com o
+        primeiro mínimo, como no caminho em Python puro.
+        """
+        delta = self.delta_matrix()
+        best_delta = delta.min()
+        ties = np.flatnonzero(delta == best_delta)
+        k = int(ties[(rng or random).randrange(len(ties))])
+        return divmod(k, self.n), int(best_delta)
+
+    def best_moves(self) -> Tuple[Tuple[Move, ...], int]:
+        """Todos os movimentos de menor delta, em ordem de (coluna, linha), e o delta."""
+        delta = self.delta_matrix()
+        best_delta = delta.min()
+        cols, rows = np.nonzero(delta == best_delta)
+        return tuple(zip(cols.tolist(), rows.tolist())), int(best_delta)
+
+    def is_conflicted(self, c: int) -> bool:
+        r = self.board[c]
+        return self.rows[r] > 1 or self.diag[r - c + self.offset] > 1 or self.anti[r + c] > 1
+
 if __name__ == "__main__":
     board1 = initial_board()
     print(f"Tabuleiro Inicial: {board1}")
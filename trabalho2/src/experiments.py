@@ -0,0 +1,80 @@
+"""
+Execução dos experimentos de busca local em paralelo e de forma reprodutível.
+
+Cada rodada recebe o seu próprio random.Random, derivado de (semente, nome do
+algoritmo, índice da rodada), e o repassa ao algoritmo pelo parâmetro `rng`.
+Assim o resultado de uma rodada não depende de quais outras rodaram antes no
+mesmo processo, e os sucessos/passos são idênticos para qualquer número de
+trabalhadores; só os tempos variam. Pelo mesmo motivo, um algoritmo com cache
+de tabuleiros recebe um BoardCache novo a cada rodada.
+"""
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+from eight_queens import BoardCache
+
+# (sucesso, passos, tempo), seguido de (acertos, falhas) do cache quando há um
+TrialResult = Tuple
+# Algoritmo: função no formato de hill_climbing (aceita rng=...) e seus
+# argumentos; um terceiro elemento opcional é a capacidade do BoardCache,
+# passado à função como cache=...
+Algorithm = Tuple
+
+
+def trial_rng(seed: int, name: str, trial: int) -> random.Random:
+    # Sementes str são convertidas por SHA-512: estáveis entre processos e execuções
+    return random.Random(f"{seed}:{name}:{trial}")
+
+
+def _run_chunk(name: str, func: Callable, args: Sequence, seed: int, trials: range,
+               cache_size: int = 0) -> Tuple[str, List[Tuple[int, TrialResult]]]:
+    out = []
+    for trial in trials:
+        rng = trial_rng(seed, name, trial)
+        kwargs = {'rng': rng}
+        if cache_size:
+            kwargs['cache'] = cache = BoardCache(cache_size)
+        start_time = time.perf_counter()
+        _, cost, steps = func(*args, **kwargs)
+        end_time = time.perf_counter()
+        result = (cost == 0, steps, end_time - start_time)
+        if cache_size:
+            result += (cache.hits, cache.misses)
+        out.append((trial, result))
+    return name, out
+
+
+def run_trials(algorithms: Dict[str, Algorithm], n_runs: int, workers: int = 1, seed: int = 0,
+               chunksize: int = 10) -> Iterator[Tuple[str, int, TrialResult]]:
+    """
+    Executa `n_runs` rodadas de cada algoritmo e gera (nome, rodada, resultado)
+    à medida que os blocos de `chunksize` rodadas terminam, fora de ordem
+    quando workers > 1. Com workers <= 1 roda tudo no próprio processo.
+    """
+    tasks = [(name, spec[0], tuple(spec[1]), seed, range(start, min(start + chunksize, n_runs)), *spec[2:])
+             for start in range(0, n_runs, chunksize)
+             for name, spec in algorithms.items()]
+
+    if workers <= 1:
+        for task in tasks:
+            name, out = _run_chunk(*task)
+            for trial, result in out:
+                yield name, trial, result
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, *task) for task in tasks]
+        for future in as_completed(futures):
+            name, out = future.result()
+            for trial, result in out:
+                yield name, trial, result
+
+
+def collect_trials(stream: Iterator[Tuple[str, int, TrialResult]]) -> Dict[str, List[TrialResult]]:
+    """Agrupa o fluxo de run_trials por algoritmo, na ordem das rodadas."""
+    by_trial: Dict[str, Dict[int, TrialResult]] = {}
+    for name, trial, result in stream:
+        by_trial.setdefault(name, {})[trial] = result
+    return {name: [trials[t] for t in sorted(trials)] for name, trials in by_trial.items()}
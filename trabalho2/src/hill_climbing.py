@@ -1,129 +1,188 @@
 import random
-import time
+import sys
 from typing import List, Tuple, Optional
-from eight_queens import Board, initial_board, conflicts, neighbors, apply
+from eight_queens import N, Board, Move, BoardCache, BoardState, CacheEntry, initial_board, initial_permutation_board, neighbors
+from experiments import run_trials, collect_trials
 
 HillClimbingResult = Tuple[Board, int, int]
 
-def hill_climbing_padrao(max_iterations: int) -> HillClimbingResult:
-    current_board = initial_board()
-    current_conflicts = conflicts(current_board)
+BACKENDS = ('python', 'numpy')
+
+def _best_neighbor(state: BoardState, backend: str, rng: Optional[random.Random] = None) -> Tuple[Optional[Move], float]:
+    """
+    Vizinho de menor delta e o delta. 'python' percorre os vizinhos uma vez,
+    sem montar a lista, e sorteia entre os empatados por amostragem de
+    reservatório (o k-ésimo empate substitui o escolhido com probabilidade
+    1/k); 'numpy' calcula a matriz de deltas inteira de uma vez
+    (BoardState.best_move). Nos dois o sorteio é uniforme entre os empates.
+    """
+    if backend == 'numpy':
+        return state.best_move(rng)
+    if backend != 'python':
+        raise ValueError(f"Backend desconhecido: '{backend}' (opções: {', '.join(BACKENDS)})")
+
+    randrange = (rng or random).randrange
+    best_move = None
+    best_delta = float('inf')
+    ties = 0
+    for mv in neighbors(state.board):
+        neighbor_delta = state.delta(mv)
+        if neighbor_delta < best_delta:
+            best_delta = neighbor_delta
+            best_move = mv
+            ties = 1
+        elif neighbor_delta == best_delta:
+            ties += 1
+            if randrange(ties) == 0:
+                best_move = mv
+    return best_move, best_delta
+
+def _best_moves(state: BoardState, backend: str) -> Tuple[Tuple[Move, ...], float]:
+    """Todos os vizinhos de menor delta e o delta, numa única passada pela vizinhança."""
+    if backend == 'numpy':
+        return state.best_moves()
+    if backend != 'python':
+        raise ValueError(f"Backend desconhecido: '{backend}' (opções: {', '.join(BACKENDS)})")
+
+    best_moves: List[Move] = []
+    best_delta = float('inf')
+    for mv in neighbors(state.board):
+        neighbor_delta = state.delta(mv)
+        if neighbor_delta < best_delta:
+            best_delta = neighbor_delta
+            best_moves = [mv]
+        elif neighbor_delta == best_delta:
+            best_moves.append(mv)
+    return tuple(best_moves), best_delta
+
+def _cached_entry(state: BoardState, backend: str, cache: BoardCache) -> CacheEntry:
+    """Entrada do tabuleiro atual; numa falha, avalia a vizinhança e guarda o resultado."""
+    entry = cache.get(state.hash, state.conflicts)
+    if entry is None:
+        moves, best_delta = _best_moves(state, backend)
+        entry = CacheEntry(state.conflicts, best_delta, moves if best_delta <= 0 else ())
+        cache.put(state.hash, entry)
+    return entry
+
+def _cached_neighbor(state: BoardState, backend: str, rng: Optional[random.Random],
+                     cache: Optional[BoardCache], stop_on_plateau: bool) -> Tuple[Optional[Move], float]:
+    """
+    _best_neighbor com o cache opcional: um tabuleiro já visto sorteia entre
+    os melhores movimentos guardados, sem reavaliar a vizinhança. Em ótimo
+    local estrito (ou platô, quando `stop_on_plateau`) devolve (None, delta).
+    """
+    if cache is None:
+        return _best_neighbor(state, backend, rng)
+
+    entry = _cached_entry(state, backend, cache)
+    if entry.best_delta > 0 or (stop_on_plateau and entry.best_delta == 0):
+        return None, entry.best_delta
+    return (rng or random).choice(entry.moves), entry.best_delta
+
+def _unvisited_lateral(state: BoardState, cache: BoardCache, moves: Tuple[Move, ...],
+                       rng: Optional[random.Random]) -> Move:
+    """Movimento lateral sorteado entre os que levam a tabuleiros fora do cache (ou entre todos)."""
+    board, zobrist = state.board, cache.zobrist
+    unvisited = [mv for mv in moves if zobrist.move(state.hash, mv[0], board[mv[0]], mv[1]) not in cache]
+    return (rng or random).choice(unvisited or moves)
+
+def hill_climbing_padrao(max_iterations: int, n: int = N, backend: str = 'python',
+                         rng: Optional[random.Random] = None, cache: Optional[BoardCache] = None) -> HillClimbingResult:
+    state = BoardState(initial_board(n, rng), cache.table(n) if cache is not None else None)
     
     for i in range(max_iterations):
-        if current_conflicts == 0:
-            return current_board, 0, i
+        if state.conflicts == 0:
+            return state.board, 0, i
 
-        best_neighbor = None
-        min_neighbor_conflicts = current_conflicts
-
-        moves = list(neighbors(current_board))
-        random.shuffle(moves)
-
-        for mv in moves:
-            neighbor = apply(current_board, mv)
-            neighbor_conflicts = conflicts(neighbor)
-            
-            if neighbor_conflicts < min_neighbor_conflicts:
-                min_neighbor_conflicts = neighbor_conflicts
-                best_neighbor = neighbor
+        best_move, best_delta = _cached_neighbor(state, backend, rng, cache, stop_on_plateau=True)
         
-        if best_neighbor is None:
-            return current_board, current_conflicts, i
+        if best_move is None or best_delta >= 0:
+            return state.board, state.conflicts, i
 
-        current_board = best_neighbor
-        current_conflicts = min_neighbor_conflicts
+        state.apply(best_move)
             
-    return current_board, current_conflicts, max_iterations
-
-def hill_climbing_movimentos_laterais(max_iterations: int, max_lateral_moves: int) -> HillClimbingResult:
-    current_board = initial_board()
-    current_conflicts = conflicts(current_board)
+    return state.board, state.conflicts, max_iterations
+
+def hill_climbing_movimentos_laterais(max_iterations: int, max_lateral_moves: int, n: int = N,
+                                      backend: str = 'python', rng: Optional[random.Random] = None,
+                                      cache: Optional[BoardCache] = None) -> HillClimbingResult:
+    """
+    Com `cache`, um tabuleiro já visto não tem a vizinhança reavaliada, e os
+    movimentos laterais evitam revisitar o platô: o sorteio fica entre os que
+    levam a tabuleiros fora do cache (entre todos, se nenhum levar).
+    """
+    state = BoardState(initial_board(n, rng), cache.table(n) if cache is not None else None)
     lateral_moves_count = 0
     
     for i in range(max_iterations):
-        if current_conflicts == 0:
-            return current_board, 0, i
-
-        best_neighbor = None
-        min_neighbor_conflicts = float('inf')
-
-        moves = list(neighbors(current_board))
-        random.shuffle(moves)
+        if state.conflicts == 0:
+            return state.board, 0, i
 
-        if not moves:
-            return current_board, current_conflicts, i
-
-        best_neighbor = apply(current_board, moves[0])
-        min_neighbor_conflicts = conflicts(best_neighbor)
-
-        for mv in moves[1:]:
-            neighbor = apply(current_board, mv)
-            neighbor_conflicts = conflicts(neighbor)
-            
-            if neighbor_conflicts < min_neighbor_conflicts:
-                min_neighbor_conflicts = neighbor_conflicts
-                best_neighbor = neighbor
+        if cache is None:
+            best_move, best_delta = _best_neighbor(state, backend, rng)
+        else:
+            entry = _cached_entry(state, backend, cache)
+            best_delta = entry.best_delta
+            if best_delta == 0:
+                best_move = _unvisited_lateral(state, cache, entry.moves, rng)
+            else:
+                best_move = (rng or random).choice(entry.moves) if entry.moves else None
+
+        if best_move is None:
+            return state.board, state.conflicts, i
         
-        if min_neighbor_conflicts > current_conflicts:
-            return current_board, current_conflicts, i
-        elif min_neighbor_conflicts == current_conflicts:
+        if best_delta > 0:
+            return state.board, state.conflicts, i
+        elif best_delta == 0:
             lateral_moves_count += 1
             if lateral_moves_count >= max_lateral_moves:
-                return current_board, current_conflicts, i
+                return state.board, state.conflicts, i
         else:
             lateral_moves_count = 0
         
-        current_board = best_neighbor
-        current_conflicts = min_neighbor_conflicts
+        state.apply(best_move)
             
-    return current_board, current_conflicts, max_iterations
-
-def hill_climbing_reinicios_aleatorios(max_restarts: int, max_iterations_per_restart: int) -> HillClimbingResult:
+    return state.board, state.conflicts, max_iterations
+
+def hill_climbing_reinicios_aleatorios(max_restarts: int, max_iterations_per_restart: int, n: int = N,
+                                       backend: str = 'python', rng: Optional[random.Random] = None,
+                                       cache: Optional[BoardCache] = None) -> HillClimbingResult:
+    """
+    Com `cache`, compartilhado entre os reinícios, uma subida que chega a um
+    ótimo local já conhecido (inclusive o próprio tabuleiro inicial) para sem
+    reavaliar a vizinhança.
+    """
     best_board = None
     best_conflicts = float('inf')
     total_steps_all_restarts = 0
     
     for _ in range(max_restarts):
-        current_board = initial_board()
-        current_conflicts = conflicts(current_board)
+        state = BoardState(initial_board(n, rng), cache.table(n) if cache is not None else None)
         
-        board_at_local_optimum = current_board
-        conflicts_at_local_optimum = current_conflicts
+        board_at_local_optimum = state.board
+        conflicts_at_local_optimum = state.conflicts
         
         steps_this_restart = 0
 
         for i in range(max_iterations_per_restart):
             steps_this_restart = i + 1
             
-            if current_conflicts == 0:
+            if state.conflicts == 0:
                 total_steps_all_restarts += steps_this_restart
-                return current_board, 0, total_steps_all_restarts
-
-            best_neighbor = None
-            min_neighbor_conflicts = current_conflicts
+                return state.board, 0, total_steps_all_restarts
 
-            moves = list(neighbors(current_board))
-            random.shuffle(moves)
-
-            for mv in moves:
-                neighbor = apply(current_board, mv)
-                neighbor_conflicts = conflicts(neighbor)
-                
-                if neighbor_conflicts < min_neighbor_conflicts:
-                    min_neighbor_conflicts = neighbor_conflicts
-                    best_neighbor = neighbor
+            best_move, best_delta = _cached_neighbor(state, backend, rng, cache, stop_on_plateau=True)
             
-            if best_neighbor is None:
-                board_at_local_optimum = current_board
-                conflicts_at_local_optimum = current_conflicts
+            if best_move is None or best_delta >= 0:
+                board_at_local_optimum = state.board
+                conflicts_at_local_optimum = state.conflicts
                 break
 
-            current_board = best_neighbor
-            current_conflicts = min_neighbor_conflicts
+            state.apply(best_move)
         
         else:
-            board_at_local_optimum = current_board
-            conflicts_at_local_optimum = current_conflicts
+            board_at_local_optimum = state.board
+            conflicts_at_local_optimum = state.conflicts
         
         total_steps_all_restarts += steps_this_restart
         
@@ -133,6 +192,61 @@ def hill_climbing_reinicios_aleatorios(max_restarts: int, max_iterations_per_res
     
     return best_board, best_conflicts, total_steps_all_restarts
 
+def min_conflicts(n: int, max_steps: int, sample_size: int = 16, noise: float = 0.1,
+                  rng: Optional[random.Random] = None) -> HillClimbingResult:
+    """
+    Min-conflicts para N-Rainhas grandes. Parte de initial_permutation_board e
+    só faz trocas de linha entre duas colunas, então nunca há conflito de
+    linha. A cada passo sorteia uma coluna do conjunto de colunas em conflito,
+    avalia a troca com `sample_size` colunas sorteadas (O(1) cada, via
+    BoardState.swap) e aplica a de menor variação, se ela não piorar; com
+    probabilidade `noise`, troca com uma coluna qualquer. As colunas que
+    deixam de estar em conflito saem do conjunto quando sorteadas.
+    """
+    state = BoardState(initial_permutation_board(n, rng=rng))
+    rand = (rng or random).random
+    swap = state.swap
+    is_conflicted = state.is_conflicted
+
+    conflicted = [c for c in range(n) if is_conflicted(c)]
+    steps = 0
+    while state.conflicts > 0 and steps < max_steps:
+        if not conflicted:
+            # Uma diagonal pode ficar em conflito sem nenhuma de suas colunas no
+            # conjunto (a coluna listada saiu dela); reconstrói por varredura
+            conflicted = [c for c in range(n) if is_conflicted(c)]
+        k = int(rand() * len(conflicted))
+        c = conflicted[k]
+        if not is_conflicted(c):
+            conflicted[k] = conflicted[-1]
+            conflicted.pop()
+            continue
+
+        steps += 1
+        best_d = -1
+        if rand() < noise:
+            # Passo aleatório: escapa de platôs e mínimos locais, comuns em
+            # tabuleiros pequenos
+            best_d = int(rand() * n)
+        else:
+            best_delta = 1
+            for _ in range(sample_size):
+                d = int(rand() * n)
+                if d == c:
+                    continue
+                delta = swap(c, d)
+                swap(c, d)
+                if delta < best_delta:
+                    best_delta = delta
+                    best_d = d
+        if best_d < 0 or best_d == c:
+            continue
+        swap(c, best_d)
+        if is_conflicted(best_d):
+            conflicted.append(best_d)
+
+    return state.board, state.conflicts, steps
+
 def print_metrics(name: str, results: List[Tuple[bool, int, float]]):
     total_runs = len(results)
     if total_runs == 0:
@@ -165,10 +279,37 @@ def print_metrics(name: str, results: List[Tuple[bool, int, float]]):
     print(f"  Tempo Médio/Exec.:  {avg_time_per_run:.6f} s")
     print(f"  Média Passos (Sucesso): {avg_steps_to_solution:.2f}")
     print(f"  Média Passos (Falha):   {avg_steps_on_failure:.2f}")
+    # Rodadas com cache de tabuleiros trazem (acertos, falhas) ao final da tupla
+    if len(results[0]) >= 5:
+        hits = sum(r[3] for r in results)
+        misses = sum(r[4] for r in results)
+        hit_rate = hits / (hits + misses) * 100 if hits + misses else float('nan')
+        print(f"  Cache (acertos/falhas): {hits}/{misses} ({hit_rate:.2f}% de acerto)")
     print("--------------------------------" + "-" * len(name))
 
+def run_min_conflicts(n: int, n_runs: int, max_steps: int, workers: int = 1, seed: int = 0):
+    print(f"Executando {n_runs} rodadas de Min-Conflicts com N = {n}...")
+    name = f"Min-Conflicts (N = {n})"
+    results = collect_trials(run_trials({name: (min_conflicts, (n, max_steps))}, n_runs, workers, seed, chunksize=1))
+    print_metrics(name, results[name])
+
 if __name__ == '__main__':
-    print("Iniciando experimentos com o Problema das 8 Rainhas...")
+    # Uso: python3 hill_climbing.py [--n-rainhas N] [--n N] [--backend python|numpy]
+    #                               [--workers W] [--seed S] [--lote K] [--cache C]
+    def option(name: str, default: str) -> str:
+        return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+    WORKERS = int(option('--workers', '1'))
+    SEED = int(option('--seed', '0'))
+
+    if '--n-rainhas' in sys.argv:
+        run_min_conflicts(int(option('--n-rainhas', '')), n_runs=5, max_steps=10_000_000, workers=WORKERS, seed=SEED)
+        sys.exit(0)
+
+    BOARD_SIZE = int(option('--n', str(N)))
+    BACKEND = option('--backend', 'python')
+
+    print(f"Iniciando experimentos com o Problema das {BOARD_SIZE} Rainhas (backend {BACKEND})...")
 
     N_RUNS = 200
 
@@ -179,37 +320,46 @@ if __name__ == '__main__':
     MAX_RESTARTS = 50
     MAX_ITER_PER_RESTART = 100
 
-    results = {
-        "HC Padrão": [],
-        "HC Mov. Laterais": [],
-        "HC Reinícios Aleatórios": []
+    algorithms = {
+        "HC Padrão": (hill_climbing_padrao, (MAX_ITER_PADRAO, BOARD_SIZE, BACKEND)),
+        "HC Mov. Laterais": (hill_climbing_movimentos_laterais, (MAX_ITER_LATERAL, MAX_LATERAL_MOVES, BOARD_SIZE, BACKEND)),
+        "HC Reinícios Aleatórios": (hill_climbing_reinicios_aleatorios, (MAX_RESTARTS, MAX_ITER_PER_RESTART, BOARD_SIZE, BACKEND))
     }
 
-    print(f"Executando {N_RUNS} rodadas de cada algoritmo...")
-
-    for i in range(N_RUNS):
-        start_time = time.perf_counter()
-        board, cost, steps = hill_climbing_padrao(MAX_ITER_PADRAO)
-        end_time = time.perf_counter()
-        results["HC Padrão"].append((cost == 0, steps, end_time - start_time))
-
-        start_time = time.perf_counter()
-        board, cost, steps = hill_climbing_movimentos_laterais(MAX_ITER_LATERAL, MAX_LATERAL_MOVES)
-        end_time = time.perf_counter()
-        results["HC Mov. Laterais"].append((cost == 0, steps, end_time - start_time))
-        
-        start_time = time.perf_counter()
-        board, cost, steps = hill_climbing_reinicios_aleatorios(MAX_RESTARTS, MAX_ITER_PER_RESTART)
-        end_time = time.perf_counter()
-        results["HC Reinícios Aleatórios"].append((cost == 0, steps, end_time - start_time))
-        
-        if (i + 1) % (N_RUNS / 10) == 0:
-            print(f"  ... {i+1}/{N_RUNS} rodadas completas.")
+    if '--cache' in sys.argv:
+        # Mesmas variantes, com um BoardCache de capacidade C por rodada
+        CACHE_SIZE = int(option('--cache', ''))
+        algorithms["HC Mov. Laterais (cache)"] = algorithms["HC Mov. Laterais"] + (CACHE_SIZE,)
+        algorithms["HC Reinícios Aleatórios (cache)"] = algorithms["HC Reinícios Aleatórios"] + (CACHE_SIZE,)
+
+    from local_search import simulated_annealing, tabu_search
+    MAX_ITER_SA = 20_000
+    MAX_ITER_TABU = 500
+    algorithms["Têmpera Simulada"] = (simulated_annealing, (MAX_ITER_SA, BOARD_SIZE))
+    algorithms["Busca Tabu"] = (tabu_search, (MAX_ITER_TABU, BOARD_SIZE))
+
+    if '--lote' in sys.argv:
+        # Requer numpy; K reinícios avançando juntos, com o mesmo orçamento total de iterações
+        from batch_hill_climbing import hill_climbing_lote
+        BATCH_SIZE = int(option('--lote', ''))
+        algorithms[f"HC em Lote (K = {BATCH_SIZE})"] = (
+            hill_climbing_lote, (BATCH_SIZE, MAX_RESTARTS * MAX_ITER_PER_RESTART, BOARD_SIZE, MAX_ITER_PER_RESTART))
+
+    print(f"Executando {N_RUNS} rodadas de cada algoritmo ({WORKERS} processo(s), semente {SEED})...")
+
+    def with_progress(stream):
+        # Os resultados chegam fora de ordem; conta rodadas completas de todos os algoritmos
+        step = max(1, N_RUNS // 10) * len(algorithms)
+        for done, item in enumerate(stream, 1):
+            yield item
+            if done % step == 0:
+                print(f"  ... {done // len(algorithms)}/{N_RUNS} rodadas completas.")
+
+    results = collect_trials(with_progress(run_trials(algorithms, N_RUNS, WORKERS, SEED)))
 
     print("\nExperimentos concluídos. Compilando métricas...")
 
-    print_metrics("HC Padrão", results["HC Padrão"])
-    print_metrics("HC Mov. Laterais", results["HC Mov. Laterais"])
-    print_metrics("HC Reinícios Aleatórios", results["HC Reinícios Aleatórios"])
+    for name in algorithms:
+        print_metrics(name, results[name])
 
     print("\nAnálise concluída.")
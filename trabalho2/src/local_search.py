@@ -0,0 +1,141 @@
+"""
+Têmpera simulada e busca tabu sobre o BoardState incremental.
+
+Ambas devolvem o mesmo HillClimbingResult dos hill climbings: o melhor
+tabuleiro visto, os seus conflitos e o número de iterações executadas.
+"""
+import math
+import random
+from typing import Callable, Dict, Optional
+
+from eight_queens import N, Move, BoardState, initial_board
+from hill_climbing import HillClimbingResult
+
+# Cronograma de resfriamento: iteração -> temperatura
+CoolingSchedule = Callable[[int], float]
+
+
+def exponential_cooling(t0: float = 2.0, alpha: float = 0.999) -> CoolingSchedule:
+    return lambda step: t0 * alpha ** step
+
+
+def linear_cooling(t0: float = 2.0, steps: int = 10_000) -> CoolingSchedule:
+    return lambda step: t0 * max(0.0, 1.0 - step / steps)
+
+
+def logarithmic_cooling(c: float = 1.0) -> CoolingSchedule:
+    return lambda step: c / math.log(step + 2)
+
+
+def simulated_annealing(max_iterations: int, n: int = N, schedule: Optional[CoolingSchedule] = None,
+                        rng: Optional[random.Random] = None) -> HillClimbingResult:
+    """
+    A cada iteração sorteia um movimento (coluna, nova_linha), avaliado em O(1)
+    por BoardState.delta, e o aceita se não piora ou, piorando em delta, com
+    probabilidade exp(-delta / T). Com T <= 0 só aceita movimentos que não
+    pioram.
+    """
+    rng = rng or random
+    schedule = schedule or exponential_cooling()
+    rand = rng.random
+    state = BoardState(initial_board(n, rng))
+    board = state.board
+
+    best_board = board[:]
+    best_conflicts = state.conflicts
+    if n < 2:
+        return best_board, best_conflicts, 0
+
+    for i in range(max_iterations):
+        if state.conflicts == 0:
+            return board[:], 0, i
+
+        c = int(rand() * n)
+        # Sorteia entre as n - 1 linhas diferentes da atual
+        new_r = int(rand() * (n - 1))
+        if new_r >= board[c]:
+            new_r += 1
+        mv = (c, new_r)
+        delta = state.delta(mv)
+
+        if delta > 0:
+            temperature = schedule(i)
+            if temperature <= 0 or rand() >= math.exp(-delta / temperature):
+                continue
+        state.apply(mv)
+        if state.conflicts < best_conflicts:
+            best_conflicts = state.conflicts
+            best_board = board[:]
+
+    return best_board, best_conflicts, max_iterations
+
+
+def tabu_search(max_iterations: int, n: int = N, tenure: Optional[int] = None,
+                rng: Optional[random.Random] = None) -> HillClimbingResult:
+    """
+    Busca tabu: a cada iteração aplica o melhor vizinho que não é tabu, mesmo
+    que piore (empates sorteados). Ao mover a coluna c da linha r, o par
+    (c, r) fica tabu por `tenure` iterações (padrão: n), impedindo a volta
+    imediata; um movimento tabu só é aceito se levar a um novo melhor
+    (critério de aspiração). A lista tabu é um buffer circular de tamanho
+    fixo, com um dicionário de contagens para consulta em O(1).
+    """
+    rng = rng or random
+    rand = rng.random
+    tenure = n if tenure is None else max(1, tenure)
+    state = BoardState(initial_board(n, rng))
+    board = state.board
+
+    ring = [-1] * tenure
+    ring_pos = 0
+    tabu: Dict[int, int] = {}
+
+    best_board = board[:]
+    best_conflicts = state.conflicts
+
+    for i in range(max_iterations):
+        if state.conflicts == 0:
+            return board[:], 0, i
+
+        best_move: Optional[Move] = None
+        best_delta = 0
+        ties = 0
+        for c in range(n):
+            current_r = board[c]
+            for new_r in range(n):
+                if new_r == current_r:
+                    continue
+                delta = state.delta((c, new_r))
+                if c * n + new_r in tabu and state.conflicts + delta >= best_conflicts:
+                    continue
+                if best_move is None or delta < best_delta:
+                    best_move, best_delta, ties = (c, new_r), delta, 1
+                elif delta == best_delta:
+                    # Amostragem de reservatório: sorteio uniforme entre empatados
+                    ties += 1
+                    if rand() * ties < 1:
+                        best_move = (c, new_r)
+
+        if best_move is None:
+            return best_board, best_conflicts, i
+
+        c, new_r = best_move
+        expired = ring[ring_pos]
+        if expired >= 0:
+            if tabu[expired] == 1:
+                del tabu[expired]
+            else:
+                tabu[expired] -= 1
+        attribute = c * n + board[c]
+        ring[ring_pos] = attribute
+        tabu[attribute] = tabu.get(attribute, 0) + 1
+        ring_pos = (ring_pos + 1) % tenure
+
+        state.apply(best_move)
+        if state.conflicts < best_conflicts:
+            best_conflicts = state.conflicts
+            best_board = board[:]
+
+    if state.conflicts == 0:
+        return board[:], 0, max_iterations
+    return best_board, best_conflicts, max_iterations